@@ -0,0 +1 @@
+"""Headless benchmarks of the WebApp's data and model paths."""
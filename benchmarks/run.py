@@ -0,0 +1,169 @@
+"""Time every hot path of the WebApp against synthetic catalogs.
+
+Each stage runs headlessly on catalogs of 5k, 50k and 500k planets and
+reports its wall time and peak resident memory: that of this process and
+that of its largest worker process, so XGBoost's native allocations and the
+process pools are counted. Results are compared with
+``benchmarks/baseline.json`` when it exists::
+
+    python -m benchmarks.run                      # compare with the baseline
+    python -m benchmarks.run --sizes 5000 50000   # smaller run
+    python -m benchmarks.run --save-baseline      # record a new baseline
+
+The exit status is 1 when a stage is slower, or needs more memory, than the
+baseline by more than ``--tolerance``.
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from exoplanets import astro
+from exoplanets import join
+from exoplanets import model as habitability
+from exoplanets import profiles
+from exoplanets.categories import TELESCOPE_GROUPS
+from exoplanets.derived import DERIVED_TABLES
+from exoplanets.synthetic import write_catalogs
+
+SIZES = (5000, 50000, 500000)
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+TOLERANCE = 1.25
+# PHL columns joined by the habitable page
+PHL_COLUMNS = ['P_NAME']
+
+
+METRICS = ('seconds', 'peak_mb', 'worker_peak_mb')
+
+
+def _reset_peak_rss():
+    # Linux only: elsewhere the peak is that of the whole run so far
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def _peak_rss(who):
+    # kilobytes on Linux, bytes on macOS
+    return resource.getrusage(who).ru_maxrss / (2 ** 20 if sys.platform == 'darwin' else 2 ** 10)
+
+
+def measure(stage, *args):
+    """Run ``stage(*args)``; return its result, wall time (s) and peak RSS (MB).
+
+    The peak RSS is a pair: this process during the stage, and the largest
+    worker process that ended during the stage (0 without one).
+    """
+    _reset_peak_rss()
+    workers = _peak_rss(resource.RUSAGE_CHILDREN)
+    started = time.perf_counter()
+    result = stage(*args)
+    elapsed = time.perf_counter() - started
+    worker_peak = _peak_rss(resource.RUSAGE_CHILDREN)
+    return result, elapsed, (_peak_rss(resource.RUSAGE_SELF), worker_peak if worker_peak > workers else 0)
+
+
+def decade_counts(nea):
+    cube = next(t for t in DERIVED_TABLES['nea'] if t.name == 'discovery_cube').build(nea)
+    return cube.groupby((cube['disc_year'] // 10) * 10)['count'].sum()
+
+
+def nea_phl_join(nea, phl):
+    return join.JoinIndex.build(nea['pl_name'], phl['P_NAME']).join(nea, phl)
+
+
+def bootstrap_ensemble(artifact, nea):
+    labeled = nea[nea['P_HABITABLE'].notna()]
+    features = artifact['pipeline'].transform(labeled).to_numpy()
+    return habitability.train_ensemble(features, labeled['P_HABITABLE'].to_numpy())
+
+
+def habitability_profiles(phl):
+    counts = next(t for t in DERIVED_TABLES['phl'] if t.name == 'habitability_profile').build(phl)
+    return {key: profiles.profile(counts, key) for key in ('S_TYPE_TEMP', 'P_TYPE', 'age_group')}
+
+
+def run(size, workdir):
+    nea_csv = os.path.join(workdir, f'nea-{size}.csv')
+    phl_csv = os.path.join(workdir, f'phl-{size}.csv')
+    write_catalogs(size, nea_csv, phl_csv)
+
+    results = {}
+
+    def stage(name, function, *args):
+        result, elapsed, (peak, worker_peak) = measure(function, *args)
+        results[name] = {'seconds': round(elapsed, 4), 'peak_mb': round(peak, 1),
+                         'worker_peak_mb': round(worker_peak, 1)}
+        print(f'{size:>8} {name:<22} {elapsed:8.3f}s {peak:9.1f} MB {worker_peak:9.1f} MB in workers',
+              flush=True)
+        return result
+
+    nea = stage('read_csv_nea', pd.read_csv, nea_csv)
+    phl = stage('read_csv_phl', pd.read_csv, phl_csv)
+    stage('decade_groupby', decade_counts, nea)
+    stage('telescope_remap', TELESCOPE_GROUPS.apply, nea['disc_telescope'])
+    stage('nea_phl_join', nea_phl_join, nea, phl[PHL_COLUMNS])
+    stage('habitability_profiles', habitability_profiles, phl)
+    stage('habitable_zone', astro.derive, nea)
+    artifact = stage('xgboost_fit', habitability.train, nea, 'benchmark', 0)
+    ensemble = stage('bootstrap_ensemble', bootstrap_ensemble, artifact, nea)
+    stage('xgboost_predict', habitability.predict, artifact, nea[nea['P_HABITABLE'].isna()])
+    stage('bootstrap_interval', habitability.predict_proba, {**artifact, 'ensemble': ensemble},
+          nea[nea['P_HABITABLE'].isna()], True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print the ratio to the baseline of each stage; return the regressed ones."""
+    regressions = []
+    for size, stages in results.items():
+        for name, current in stages.items():
+            reference = baseline.get(size, {}).get(name)
+            if not reference:
+                continue
+            # baselines recorded before a metric existed are compared on the others
+            ratios = {metric: current[metric] / max(reference[metric], 1e-6)
+                      for metric in METRICS if reference.get(metric)}
+            regressed = [metric for metric, ratio in ratios.items() if ratio > tolerance]
+            if regressed:
+                regressions.append((size, name))
+            flag = f"  << regression ({', '.join(regressed)})" if regressed else ''
+            ratios = ', '.join(f'{metric} x{ratio:.2f}' for metric, ratio in ratios.items())
+            print(f'{size:>8} {name:<22} {ratios} vs baseline{flag}')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the WebApp hot paths.")
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help="time or memory ratio above which a stage counts as a regression")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = {str(size): run(size, workdir) for size in args.sizes}
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f'baseline saved to {args.baseline}')
+        return 0
+    if not os.path.exists(args.baseline):
+        print('no baseline to compare with, run with --save-baseline to record one')
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""Data and model layer behind the Exoplanet Discovery WebApp.
+
+Everything in this package but ``exoplanets.pages`` is importable without
+Streamlit, so that the same code paths can be used from batch jobs and
+benchmarks.
+"""
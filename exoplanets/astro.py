@@ -0,0 +1,120 @@
+"""Derived astrophysical quantities of the NEA planets, vectorized.
+
+From the stellar and orbital columns of the NEA catalog, ``derive`` computes
+for every planet at once:
+
+- ``luminosity`` of the star (L☉), from ``st_lum`` (log10) or else from its
+  radius and effective temperature (Stefan-Boltzmann);
+- ``semi_major_axis`` (AU), from ``pl_orbsmax`` or else from the orbital
+  period and the stellar mass (Kepler's third law);
+- ``flux``, the orbit-averaged stellar flux received (S⊕);
+- ``eq_temperature``, the equilibrium temperature (K) for a Bond albedo of
+  ``ALBEDO``;
+- the habitable-zone limits of Kopparapu et al. (2014), as distances (AU):
+  conservative (runaway / maximum greenhouse) and optimistic (recent Venus /
+  early Mars);
+- ``hz_index``, the position of the flux within the conservative zone, 0 at
+  its inner edge and 1 at its outer one, and the ``hz_zone`` it falls in.
+
+Quantities are NaN where their inputs are missing. The limits are fitted for
+stars of 2600 to 7200 K; cooler or hotter stars use the closest end of that
+range. Planets of the PHL catalog and newer discoveries are therefore placed
+the same way, without the precomputed PHL columns.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+INPUT_COLUMNS = ['st_teff', 'st_rad', 'st_lum', 'st_mass', 'pl_orbsmax', 'pl_orbper', 'pl_orbeccen']
+SUN_TEFF = 5780
+TEFF_RANGE = (2600, 7200)
+# equilibrium temperature of a black body at 1 AU from the Sun, K
+EARTH_EQ_TEMPERATURE = 278.3
+ALBEDO = 0.3
+# Kopparapu et al. (2014), 1 Earth mass: S_eff(Sun), a, b, c, d
+HZ_LIMITS = {
+    'recent_venus': (1.776, 2.136e-4, 2.533e-8, -1.332e-11, -3.097e-15),
+    'runaway_greenhouse': (1.107, 1.332e-4, 1.580e-8, -8.308e-12, -1.931e-15),
+    'maximum_greenhouse': (0.356, 6.171e-5, 1.698e-9, -3.198e-12, -5.575e-16),
+    'early_mars': (0.320, 5.547e-5, 1.526e-9, -2.874e-12, -5.011e-16),
+}
+ZONES = {'conservative': ('runaway_greenhouse', 'maximum_greenhouse'),
+         'optimistic': ('recent_venus', 'early_mars')}
+HZ_ZONES = ['trop chaude', 'optimiste', 'conservatrice', 'trop froide']
+
+_derived = {}
+_lock = threading.Lock()
+
+
+def _column(frame, name):
+    if name not in frame:
+        return np.full(len(frame), np.nan)
+    return frame[name].to_numpy(dtype=float, na_value=np.nan)
+
+
+def hz_flux(teff, limit):
+    """Effective flux (S⊕) at the habitable-zone ``limit`` of stars of temperature ``teff``."""
+    seff, *coefficients = HZ_LIMITS[limit]
+    t = np.clip(teff, *TEFF_RANGE) - SUN_TEFF
+    # Horner's scheme of seff + a t + b t² + c t³ + d t⁴
+    flux = np.zeros_like(t)
+    for coefficient in reversed(coefficients):
+        flux = (flux + coefficient) * t
+    return seff + flux
+
+
+def derive(planets):
+    """Derived quantities of each row of ``planets``, aligned on its index."""
+    teff = _column(planets, 'st_teff')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        luminosity = 10 ** _column(planets, 'st_lum')
+        luminosity = np.where(np.isnan(luminosity),
+                              _column(planets, 'st_rad') ** 2 * (teff / SUN_TEFF) ** 4, luminosity)
+
+        period_years = _column(planets, 'pl_orbper') / 365.25
+        axis = _column(planets, 'pl_orbsmax')
+        axis = np.where(np.isnan(axis), np.cbrt(_column(planets, 'st_mass') * period_years ** 2), axis)
+
+        eccentricity = np.nan_to_num(_column(planets, 'pl_orbeccen')).clip(0, 0.99)
+        flux = luminosity / axis ** 2 / np.sqrt(1 - eccentricity ** 2)
+        quantities = {'luminosity': luminosity,
+                      'semi_major_axis': axis,
+                      'flux': flux,
+                      'eq_temperature': EARTH_EQ_TEMPERATURE * ((1 - ALBEDO) * flux) ** 0.25}
+
+        limits = {limit: np.where(np.isnan(teff), np.nan, hz_flux(teff, limit)) for limit in HZ_LIMITS}
+        for zone, (inner, outer) in ZONES.items():
+            quantities[f'hz_inner_{zone}'] = np.sqrt(luminosity / limits[inner])
+            quantities[f'hz_outer_{zone}'] = np.sqrt(luminosity / limits[outer])
+        inner, outer = (limits[limit] for limit in ZONES['conservative'])
+        quantities['hz_index'] = (inner - flux) / (inner - outer)
+
+    # 0: hotter than the optimistic zone, ..., 3: colder; -1 when unknown
+    codes = (flux <= limits['recent_venus']).astype(np.int64)
+    codes += flux <= limits['runaway_greenhouse']
+    codes += flux < limits['maximum_greenhouse']
+    codes += flux < limits['early_mars']
+    codes = np.where(np.isnan(flux) | np.isnan(teff), -1, codes)
+    # optimistic on both sides of the conservative zone
+    codes = np.where(codes == 3, 1, np.where(codes == 4, 3, codes))
+    quantities['hz_zone'] = pd.Categorical.from_codes(codes, HZ_ZONES)
+    return pd.DataFrame(quantities, index=planets.index)
+
+
+def derived_quantities(planets, snapshot=None):
+    """``derive(planets)``, memoized per snapshot version and input columns.
+
+    Without ``snapshot`` the result is kept for as long as the same frame is
+    passed.
+    """
+    key = (snapshot if snapshot is not None else id(planets),
+           tuple(column for column in INPUT_COLUMNS if column in planets))
+    cached = _derived.get(key)
+    if cached is not None and (snapshot is not None or cached[0] is planets):
+        return cached[1]
+    derived = derive(planets)
+    with _lock:
+        _derived.clear()
+        _derived[key] = (planets, derived)
+    return derived
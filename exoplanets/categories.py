@@ -0,0 +1,50 @@
+"""Declarative grouping of raw catalog values into display categories.
+
+A ``CategoryMapping`` is a list of ``(label, values)`` rules, plus values to
+keep as they are and a default label for everything else. Applying it
+factorizes the column once and maps the codes through a lookup table, so the
+cost is one vectorized pass whatever the number of rules, and the source
+frame is never copied or modified.
+"""
+import numpy as np
+import pandas as pd
+
+
+class CategoryMapping:
+
+    def __init__(self, rules, keep=(), default=None):
+        self.labels = []
+        self._codes = {}
+        for label, values in rules:
+            code = self._label_code(label)
+            for value in values:
+                self._codes.setdefault(value, code)
+        for value in keep:
+            self._codes.setdefault(value, self._label_code(value))
+        self.default = default
+        self._default_code = -1 if default is None else self._label_code(default)
+
+    def _label_code(self, label):
+        if label not in self.labels:
+            self.labels.append(label)
+        return self.labels.index(label)
+
+    def apply(self, values):
+        """Categorical Series of labels aligned on ``values``.
+
+        Values matched by no rule, missing values included, get the default
+        label (or NaN when there is none).
+        """
+        codes, uniques = pd.factorize(values)
+        lookup = np.array([self._codes.get(value, self._default_code) for value in uniques]
+                          + [self._default_code], dtype=np.int64)
+        # factorize gives -1 to missing values, which picks the trailing default
+        mapped = pd.Categorical.from_codes(lookup[codes], categories=self.labels)
+        return pd.Series(mapped, index=getattr(values, 'index', None), name=getattr(values, 'name', None))
+
+
+# camera lenses grouped together, Kepler on its own, every other instrument is a telescope
+TELESCOPE_GROUPS = CategoryMapping(
+    [('Objectif photo', ['Canon 400mm f/2.8L', 'Mamiya 645 80mm f/1.9', 'Canon 200mm f/1.8L'])],
+    keep=['0.95 m Kepler Telescope'],
+    default='Telescope')
@@ -0,0 +1,163 @@
+"""Delta ingest of a new catalog dump into an existing snapshot.
+
+The new dump is read in chunks and every row is compared, by planet name and
+row hash, with the stored snapshot. Only inserted and updated rows are kept in
+memory; they are applied to the snapshot together with the deletes, and the
+derived tables touched by the change are refreshed::
+
+    python -m exoplanets.delta nea=planets.csv
+
+When the snapshot does not exist yet, or the dump's columns differ from it,
+this falls back to a full ingest.
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from exoplanets import derived
+from exoplanets.snapshot import (SNAPSHOT_DIR, ingest, snapshot_path, to_snapshot_dtypes,
+                                 write_snapshot)
+
+CHUNKSIZE = 50000
+KEY = 'pl_name'
+# planet name column of the snapshots not keyed by ``KEY``
+KEYS = {'phl': 'P_NAME'}
+
+
+class Delta:
+    """Rows changed between a snapshot and a new dump.
+
+    ``removed`` holds the old version of updated and deleted rows, ``added``
+    the new version of updated and inserted rows.
+    """
+
+    def __init__(self, inserted, updated, deleted, changed_columns, removed, added):
+        self.inserted = inserted
+        self.updated = updated
+        self.deleted = deleted
+        self.changed_columns = set(changed_columns)
+        self.removed = removed
+        self.added = added
+
+    def __bool__(self):
+        return bool(len(self.inserted) or len(self.updated) or len(self.deleted))
+
+    def affects(self, columns):
+        """Whether something depending on ``columns`` must be refreshed."""
+        return bool(len(self.inserted) or len(self.deleted)
+                    or self.changed_columns.intersection(columns))
+
+    def summary(self):
+        return (f'{len(self.inserted)} inserted, {len(self.updated)} updated, '
+                f'{len(self.deleted)} deleted')
+
+
+def row_hashes(frame):
+    """One uint64 per row, stable across CSV and Parquet reads of the same values.
+
+    Numbers are hashed as floats and everything else as Python objects, so
+    that an int column read back as float (or a categorical read as text)
+    does not look like a change.
+    """
+    normalized = pd.DataFrame({
+        column: (frame[column].astype('float64')
+                 if pd.api.types.is_numeric_dtype(frame[column])
+                 and not isinstance(frame[column].dtype, pd.CategoricalDtype)
+                 else frame[column].astype(object))
+        for column in frame.columns
+    })
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+def _changed_columns(old_rows, new_rows, key=KEY):
+    old_rows = old_rows.set_index(key).astype(object)
+    new_rows = new_rows.set_index(key).astype(object).reindex(old_rows.index)
+    differs = ~(old_rows.eq(new_rows) | (old_rows.isna() & new_rows.isna()))
+    return [column for column in differs.columns if differs[column].any()]
+
+
+def diff(old, source, chunksize=CHUNKSIZE, key=KEY):
+    """Compare snapshot frame ``old`` with the dump at ``source``.
+
+    Returns ``None`` when the dump cannot be diffed row by row (different
+    columns or duplicated names), meaning a full ingest is needed.
+    """
+    if old[key].duplicated().any():
+        return None
+    old_index = pd.Index(old[key])
+    old_hashes = row_hashes(old)
+    seen = np.zeros(len(old), dtype=bool)
+    inserted, updated, changed = [], [], []
+
+    for chunk in pd.read_csv(source, chunksize=chunksize):
+        if list(chunk.columns) != list(old.columns):
+            return None
+        positions = old_index.get_indexer(chunk[key])
+        known = positions >= 0
+        seen[positions[known]] = True
+
+        hashes = row_hashes(chunk)
+        modified = np.zeros(len(chunk), dtype=bool)
+        modified[known] = hashes[known] != old_hashes[positions[known]]
+
+        inserted.append(chunk.loc[~known, key].to_numpy())
+        updated.append(chunk.loc[modified, key].to_numpy())
+        changed.append(chunk[~known | modified])
+
+    inserted = np.concatenate(inserted) if inserted else np.array([], dtype=object)
+    updated = np.concatenate(updated) if updated else np.array([], dtype=object)
+    deleted = old.loc[~seen, key].to_numpy()
+    added = pd.concat(changed, ignore_index=True) if changed else old.iloc[:0]
+    removed = old[old[key].isin(updated) | ~seen]
+
+    changed_columns = []
+    if len(updated):
+        changed_columns = _changed_columns(removed[removed[key].isin(updated)],
+                                           added[added[key].isin(updated)], key)
+    return Delta(inserted, updated, deleted, changed_columns, removed, added)
+
+
+def apply_delta(name, source, snapshot_dir=None, chunksize=CHUNKSIZE):
+    """Update snapshot ``name`` from the dump at ``source``.
+
+    Returns the ``Delta`` that was applied, or ``None`` if a full ingest was
+    done instead.
+    """
+    path = snapshot_path(name, snapshot_dir)
+    try:
+        old = pd.read_parquet(path)
+    except FileNotFoundError:
+        old = None
+    key = KEYS.get(name, KEY)
+    delta = diff(old, source, chunksize, key) if old is not None else None
+    if delta is None:
+        ingest(name, source, snapshot_dir)
+        return None
+    if not delta:
+        return delta
+
+    kept = old[~old[key].isin(delta.removed[key])]
+    frame = to_snapshot_dtypes(pd.concat([kept, delta.added.astype(kept.dtypes.to_dict(), errors='ignore')],
+                                         ignore_index=True))
+    write_snapshot(name, frame, source, snapshot_dir)
+    derived.refresh(name, delta, frame, snapshot_dir)
+    return delta
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a new catalog dump to its snapshot.")
+    parser.add_argument('catalogs', nargs='+', metavar='NAME=SOURCE',
+                        help="snapshot name and CSV path or URL, e.g. nea=planets.csv")
+    parser.add_argument('--snapshot-dir', default=SNAPSHOT_DIR)
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    for catalog in args.catalogs:
+        name, source = catalog.split('=', 1)
+        delta = apply_delta(name, source, args.snapshot_dir, args.chunksize)
+        print(f'{name}: ' + ('full ingest' if delta is None else delta.summary()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""Tables derived from a catalog snapshot and stored next to it.
+
+Every table registered in ``DERIVED_TABLES`` is built in full when a
+snapshot is ingested. When a delta is applied (see ``exoplanets.delta``) a
+table is only refreshed if the delta touches it: any insert or delete, or an
+update of one of the columns it ``depends_on``. Tables refresh from the
+touched rows alone (their old and new versions), not from the whole catalog.
+"""
+import os
+
+import pandas as pd
+
+from exoplanets.categories import TELESCOPE_GROUPS
+from exoplanets.loader import load_catalog
+from exoplanets.profiles import PROFILE_COLUMNS, profile_keys
+from exoplanets.snapshot import SNAPSHOT_DIR
+
+
+# stands for missing key values while counts are aligned, NaN never matches itself
+MISSING = '<missing>'
+
+
+def _indexed_counts(table, keys):
+    values = table[keys].astype(object)
+    values = values.where(values.notna(), MISSING)
+    index = pd.MultiIndex.from_arrays([pd.Index(values[key], dtype=object) for key in keys], names=keys)
+    return pd.Series(table['count'].to_numpy(), index=index, name='count')
+
+
+class CountTable:
+    """Number of snapshot rows per combination of key values.
+
+    ``prepare`` maps catalog rows to the key columns; by default the keys are
+    the ``depends_on`` columns themselves. Rows with missing key values are
+    counted too, under NaN.
+    """
+
+    def __init__(self, name, depends_on, prepare=None):
+        self.name = name
+        self.depends_on = list(depends_on)
+        self.prepare = prepare
+
+    def _keys(self, frame):
+        return self.prepare(frame) if self.prepare else frame[self.depends_on]
+
+    def build(self, frame):
+        keys = self._keys(frame)
+        # grouped as objects: pandas drops the NaN groups of categorical keys, even with dropna=False
+        keys = keys.astype({c: object for c in keys.columns if keys[c].dtype.name == 'category'})
+        counts = keys.groupby(list(keys.columns), dropna=False).size()
+        return counts.rename('count').reset_index()
+
+    def update(self, table, removed, added):
+        keys = [c for c in table.columns if c != 'count']
+        counts = _indexed_counts(table, keys)
+        for rows, sign in ((added, 1), (removed, -1)):
+            if len(rows):
+                counts = counts.add(sign * _indexed_counts(self.build(rows), keys), fill_value=0)
+        table = counts[counts > 0].astype('int64').reset_index()
+        table[keys] = table[keys].mask(table[keys] == MISSING).infer_objects()
+        return table
+
+
+def _cube_keys(frame):
+    return pd.DataFrame({'disc_year': frame['disc_year'],
+                         'discoverymethod': frame['discoverymethod'],
+                         'telescope_group': TELESCOPE_GROUPS.apply(frame['disc_telescope']),
+                         'disc_locale': frame['disc_locale']})
+
+
+CUBE_COLUMNS = ['disc_year', 'discoverymethod', 'disc_telescope', 'disc_locale']
+
+DERIVED_TABLES = {
+    'nea': [
+        # discovery counts behind the Accueil and "Observer" charts
+        CountTable('discovery_cube', CUBE_COLUMNS, prepare=_cube_keys),
+    ],
+    'phl': [
+        # planets by star type, planet type, star age group and habitability,
+        # behind the profiles of the habitable page (`exoplanets.profiles`)
+        CountTable('habitability_profile', PROFILE_COLUMNS, prepare=profile_keys),
+    ],
+}
+
+
+def derived_path(snapshot_name, table_name, snapshot_dir=None):
+    return os.path.join(snapshot_dir or SNAPSHOT_DIR, 'derived', snapshot_name, f'{table_name}.parquet')
+
+
+def _write(table, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table.to_parquet(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+
+
+def build_all(snapshot_name, frame, snapshot_dir=None):
+    """Build every table derived from snapshot ``snapshot_name`` from scratch."""
+    for table in DERIVED_TABLES.get(snapshot_name, []):
+        _write(table.build(frame), derived_path(snapshot_name, table.name, snapshot_dir))
+
+
+def refresh(snapshot_name, delta, frame, snapshot_dir=None):
+    """Bring the derived tables up to date with ``delta``; return the refreshed names.
+
+    ``frame`` is the new snapshot, only used to build tables that do not
+    exist yet.
+    """
+    refreshed = []
+    for table in DERIVED_TABLES.get(snapshot_name, []):
+        if not delta.affects(table.depends_on):
+            continue
+        path = derived_path(snapshot_name, table.name, snapshot_dir)
+        if os.path.exists(path):
+            result = table.update(pd.read_parquet(path), delta.removed, delta.added)
+        else:
+            result = table.build(frame)
+        _write(result, path)
+        refreshed.append(table.name)
+    return refreshed
+
+
+def load_derived(snapshot_name, table_name, snapshot_dir=None):
+    """Stored derived table, or ``None`` if the snapshot was never ingested."""
+    path = derived_path(snapshot_name, table_name, snapshot_dir)
+    return load_catalog(path) if os.path.exists(path) else None
+
+
+_built = {}
+
+
+def load_or_build(snapshot_name, table_name, load_frame, snapshot_dir=None):
+    """Stored derived table, or one built in memory from ``load_frame()``.
+
+    The in-memory build is kept for as long as ``load_frame`` keeps returning
+    the same (cached) frame, so it also happens once per catalog version.
+    """
+    table = load_derived(snapshot_name, table_name, snapshot_dir)
+    if table is not None:
+        return table
+
+    frame = load_frame()
+    cached = _built.get((snapshot_name, table_name))
+    if cached is not None and cached[0] is frame:
+        return cached[1]
+    definition = next(t for t in DERIVED_TABLES[snapshot_name] if t.name == table_name)
+    table = definition.build(frame)
+    _built[snapshot_name, table_name] = (frame, table)
+    return table
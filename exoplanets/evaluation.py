@@ -0,0 +1,201 @@
+"""Cross-validated comparison of the candidate habitability classifiers.
+
+Each candidate is fitted and scored on every fold of a stratified K-fold
+split of the labeled planets, with a ``FeaturePipeline`` fitted on the
+training fold only. Folds run in parallel in a process pool; the catalog is
+sent once to each worker rather than with every job::
+
+    python -m exoplanets.evaluation --nea planets.csv
+
+Besides accuracy, each candidate is scored on the recall of the habitable
+planets, which are rare enough for a classifier that never predicts them to
+reach a very high accuracy, and on its fit time and per-row predict latency.
+Results are saved next to the models, keyed like them by the hash of the
+labeled rows, for the ML page to read. The page never evaluates on the
+request path: when a catalog version has no results yet, it starts
+``evaluate_in_background`` and shows the scores once they are saved.
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from sklearn.ensemble import AdaBoostClassifier, BaggingClassifier, RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, recall_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+from xgboost import XGBClassifier
+
+from exoplanets.features import TARGET, FeaturePipeline
+from exoplanets.model import MODEL_DIR, training_version
+from exoplanets.snapshot import load_snapshot
+
+FOLDS = 5
+# models are fitted single-threaded, the parallelism comes from the pool
+CANDIDATES = {
+    'SGDClassifier': lambda: make_pipeline(StandardScaler(), SGDClassifier(random_state=0)),
+    'DecisionTreeClassifier': lambda: DecisionTreeClassifier(random_state=0),
+    'KNeighborsClassifier': lambda: make_pipeline(StandardScaler(), KNeighborsClassifier()),
+    'BaggingClassifier': lambda: BaggingClassifier(random_state=0),
+    'RandomForestClassifier': lambda: RandomForestClassifier(random_state=0),
+    'AdaBoostClassifier': lambda: AdaBoostClassifier(random_state=0),
+    'XGBoost': lambda: XGBClassifier(n_jobs=1),
+}
+METRICS = ['accuracy', 'habitable_recall', 'fit_seconds', 'predict_us_per_row']
+
+logger = logging.getLogger(__name__)
+_results = {}
+_lock = threading.Lock()
+# dataset versions evaluated by a background thread of this process
+_running = set()
+_running_lock = threading.Lock()
+# labeled planets of the worker process, set by _init_worker
+_labeled = None
+
+
+def _init_worker(labeled):
+    global _labeled
+    _labeled = labeled
+
+
+def _evaluate_fold(name, train_rows, test_rows):
+    train, test = _labeled.iloc[train_rows], _labeled.iloc[test_rows]
+
+    started = time.perf_counter()
+    pipeline = FeaturePipeline().fit(train)
+    model = CANDIDATES[name]().fit(pipeline.transform(train), train[TARGET])
+    fit_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    predicted = model.predict(pipeline.transform(test))
+    predict_seconds = time.perf_counter() - started
+
+    habitable = test[TARGET].to_numpy() > 0
+    return {'model': name,
+            'accuracy': accuracy_score(test[TARGET], predicted),
+            'habitable_recall': recall_score(habitable, predicted > 0, zero_division=0),
+            'fit_seconds': fit_seconds,
+            'predict_us_per_row': predict_seconds / len(test) * 1e6}
+
+
+def evaluate(planets, candidates=None, folds=FOLDS, workers=None):
+    """Mean cross-validated metrics of each candidate, one row per model."""
+    labeled = planets[planets[TARGET].notna()].reset_index(drop=True)
+    candidates = list(candidates or CANDIDATES)
+    splits = list(StratifiedKFold(folds, shuffle=True, random_state=0).split(labeled, labeled[TARGET]))
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(labeled,)) as pool:
+        jobs = [pool.submit(_evaluate_fold, name, train_rows, test_rows)
+                for name in candidates for train_rows, test_rows in splits]
+        scores = pd.DataFrame([job.result() for job in jobs])
+    return scores.groupby('model', sort=False)[METRICS].mean()
+
+
+def results_path(dataset_version, model_dir=None):
+    return os.path.join(model_dir or MODEL_DIR, f'evaluation-{dataset_version}.json')
+
+
+def save(results, dataset_version, folds=FOLDS, model_dir=None):
+    path = results_path(dataset_version, model_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'dataset_version': dataset_version, 'folds': folds,
+                   'results': results.reset_index().to_dict('records')}, f, indent=1)
+    os.replace(path + '.tmp', path)
+    return path
+
+
+def load(dataset_version, model_dir=None):
+    """Saved results for ``dataset_version``, or ``None`` if not evaluated yet."""
+    try:
+        with open(results_path(dataset_version, model_dir)) as f:
+            saved = json.load(f)
+    except FileNotFoundError:
+        return None
+    return pd.DataFrame(saved['results']).set_index('model')
+
+
+def load_or_evaluate(planets, snapshot=None, model_dir=None):
+    """Comparison of the candidates on this catalog, memoized per process.
+
+    Only evaluates (and saves) when no results exist for the labeled rows
+    of ``planets``; ``snapshot`` is used as in ``model.load_or_train``.
+    """
+    dataset_version = training_version(planets, snapshot)
+    results = _results.get(dataset_version)
+    if results is not None:
+        return results
+
+    with _lock:
+        results = _results.get(dataset_version)
+        if results is None:
+            results = load(dataset_version, model_dir)
+        if results is None:
+            results = evaluate(planets)
+            save(results, dataset_version, model_dir=model_dir)
+        _results[dataset_version] = results
+    return results
+
+
+def get_results(planets, snapshot=None, model_dir=None):
+    """Saved comparison of the candidates on this catalog, ``None`` if not evaluated yet."""
+    dataset_version = training_version(planets, snapshot)
+    results = _results.get(dataset_version)
+    if results is None:
+        results = load(dataset_version, model_dir)
+        if results is not None:
+            _results[dataset_version] = results
+    return results
+
+
+def evaluate_in_background(planets, snapshot=None, model_dir=None):
+    """``load_or_evaluate`` in a background thread, started once per catalog version."""
+    dataset_version = training_version(planets, snapshot)
+    with _running_lock:
+        if dataset_version in _running:
+            return
+        _running.add(dataset_version)
+
+    def run():
+        try:
+            load_or_evaluate(planets, snapshot, model_dir)
+        except Exception:
+            logger.exception('evaluation of dataset %s failed', dataset_version)
+            # let a later visit try again
+            with _running_lock:
+                _running.discard(dataset_version)
+
+    threading.Thread(target=run, name='evaluation', daemon=True).start()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cross-validate the candidate habitability classifiers.")
+    parser.add_argument('--nea', default='planets.csv',
+                        help="NEA catalog CSV, used when no 'nea' snapshot was ingested")
+    parser.add_argument('--model-dir', default=MODEL_DIR)
+    parser.add_argument('--folds', type=int, default=FOLDS)
+    parser.add_argument('--workers', type=int, default=None, help="processes, all cores by default")
+    parser.add_argument('--force', action='store_true', help="re-evaluate even if results exist")
+    args = parser.parse_args(argv)
+
+    planets = load_snapshot('nea', args.nea)
+    version = training_version(planets)
+    results = None if args.force else load(version, args.model_dir)
+    if results is None:
+        results = evaluate(planets, folds=args.folds, workers=args.workers)
+        save(results, version, args.folds, args.model_dir)
+    with pd.option_context('display.width', 200):
+        print(results.round(4))
+    print(f'results for dataset {version}: {results_path(version, args.model_dir)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Feature pipeline turning catalog rows into the classifier's input matrix.
+
+The features are the numeric catalog columns, the stellar flux, equilibrium
+temperature and habitable-zone position derived from them (see
+``exoplanets.astro``), plus integer codes for a few categorical ones. ``fit``
+records the column layout, the vocabulary of each categorical column and the
+mean used to fill each numeric column; after that
+``transform`` encodes any batch of rows on its own, so training and
+prediction always see the same columns and the same codes.
+"""
+import numpy as np
+import pandas as pd
+
+from exoplanets.astro import derive
+
+CATEGORICAL_FEATURES = ('pl_letter', 'discoverymethod', 'disc_locale')
+DERIVED_FEATURES = ('flux', 'eq_temperature', 'hz_index')
+TARGET = 'P_HABITABLE'
+
+
+class FeaturePipeline:
+    """Fit once on the training rows, then ``transform`` new rows in O(rows)."""
+
+    def __init__(self, categorical=CATEGORICAL_FEATURES, target=TARGET, derived=DERIVED_FEATURES):
+        self.categorical = list(categorical)
+        self.target = target
+        self.derived = list(derived)
+
+    def _derived(self, planets):
+        # computed from the rows themselves, so any batch gets them
+        return derive(planets)[self.derived] if self.derived else pd.DataFrame(index=planets.index)
+
+    def fit(self, planets):
+        numeric = planets.select_dtypes(include=np.number)
+        catalog_columns = [c for c in numeric.columns
+                           if c != self.target and c not in self.categorical and c not in self.derived]
+        self.numeric_columns_ = catalog_columns + self.derived
+        self.means_ = np.concatenate([numeric[catalog_columns].mean().to_numpy(dtype=float),
+                                      self._derived(planets).mean().to_numpy(dtype=float)])
+        # columns with no value at all in the training rows are filled with 0
+        self.means_ = np.nan_to_num(self.means_)
+        # codes follow the order of first appearance, as factorize() does
+        self.vocabularies_ = {column: pd.Index(pd.unique(planets[column].dropna().to_numpy(dtype=object)))
+                              for column in self.categorical}
+        return self
+
+    @property
+    def columns(self):
+        return self.numeric_columns_ + self.categorical
+
+    def transform(self, planets):
+        """Feature matrix for ``planets``, with missing values imputed.
+
+        Missing numeric columns are filled entirely with their training mean;
+        categorical values not seen during ``fit`` are encoded as -1.
+        """
+        out = np.empty((len(planets), len(self.columns)), dtype=float)
+        derived = self._derived(planets)
+        for i, column in enumerate(self.numeric_columns_):
+            source = derived if column in self.derived else planets
+            if column in source.columns:
+                values = source[column].to_numpy(dtype=float, na_value=np.nan)
+                out[:, i] = np.where(np.isnan(values), self.means_[i], values)
+            else:
+                out[:, i] = self.means_[i]
+
+        offset = len(self.numeric_columns_)
+        for i, column in enumerate(self.categorical):
+            if column in planets.columns:
+                values = planets[column].to_numpy(dtype=object)
+                out[:, offset + i] = self.vocabularies_[column].get_indexer(values)
+            else:
+                out[:, offset + i] = -1
+        return pd.DataFrame(out, columns=self.columns, index=planets.index)
+
+    def fit_transform(self, planets):
+        return self.fit(planets).transform(planets)
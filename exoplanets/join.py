@@ -0,0 +1,123 @@
+"""Persisted index joining NEA planets to their PHL catalog row.
+
+Names are matched exactly first, then on a normalized form (case, spacing
+and punctuation ignored, Gliese/Gl/GJ prefixes unified), so that spelling
+variants between the two catalogs still join. The index is one PHL row
+position per NEA row, built once per pair of snapshot versions and stored
+with the derived tables; joining then becomes a positional lookup.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from exoplanets.snapshot import SNAPSHOT_DIR
+
+EXACT, NORMALIZED, UNMATCHED = 'exact', 'normalized', 'unmatched'
+PREFIX_ALIASES = r'^(?:gliese|gl)(?=[\s\-_]*\d)'
+
+_built = {}
+
+
+def normalize_names(names):
+    """Comparable form of planet names: ``'Gliese 667 C c'`` -> ``'gj667cc'``."""
+    names = pd.Series(names, dtype=object).str.casefold().str.strip()
+    names = names.str.replace(PREFIX_ALIASES, 'gj', regex=True)
+    return names.str.replace(r'[^0-9a-z]', '', regex=True)
+
+
+def _first_positions(keys):
+    keys = pd.Index(keys)
+    first = ~keys.duplicated(keep='first') & keys.notna()
+    return keys[first], np.flatnonzero(first)
+
+
+def _lookup(keys, positions, queries):
+    found = keys.get_indexer(queries)
+    return np.where(found >= 0, positions[found], -1)
+
+
+class JoinIndex:
+    """PHL row position (-1 when unmatched) and match kind for each NEA row."""
+
+    def __init__(self, phl_rows, match):
+        self.phl_rows = np.asarray(phl_rows, dtype=np.int64)
+        self.match = pd.Categorical(match, categories=[EXACT, NORMALIZED, UNMATCHED])
+
+    @classmethod
+    def build(cls, nea_names, phl_names):
+        keys, positions = _first_positions(phl_names)
+        rows = _lookup(keys, positions, nea_names)
+        match = np.where(rows >= 0, EXACT, UNMATCHED).astype(object)
+
+        missing = rows < 0
+        if missing.any():
+            keys, positions = _first_positions(normalize_names(phl_names))
+            variants = _lookup(keys, positions, normalize_names(np.asarray(nea_names)[missing]))
+            rows[missing] = variants
+            match[np.flatnonzero(missing)[variants >= 0]] = NORMALIZED
+        return cls(rows, match)
+
+    def join(self, planets, phl):
+        """``planets`` with the matching ``phl`` columns, like a left merge on the names.
+
+        The columns of ``planets`` are not copied, only the ``phl`` ones are
+        gathered; the joined frame is kept for as long as the same frames are
+        joined.
+        """
+        cached = _built.get('joined')
+        if cached is not None and cached[0] is self and cached[1] is planets and cached[2] is phl:
+            return cached[3]
+        phl_part = phl.reset_index(drop=True).reindex(self.phl_rows).set_axis(planets.index)
+        # side by side without copying the (shared) planet columns
+        joined = pd.concat([planets, phl_part], axis=1, copy=False)
+        _built['joined'] = (self, planets, phl, joined)
+        return joined
+
+    def unmatched(self, planets):
+        """Names of planets rated by the PHL (``P_HABITABLE`` set) that were not found in its catalog."""
+        missing = (self.match == UNMATCHED) & planets['P_HABITABLE'].notna().to_numpy()
+        return planets.loc[missing, 'pl_name'].tolist()
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        frame = pd.DataFrame({'phl_row': self.phl_rows, 'match': self.match})
+        frame.to_parquet(path + '.tmp', index=False)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path):
+        frame = pd.read_parquet(path)
+        return cls(frame['phl_row'].to_numpy(), frame['match'])
+
+
+def index_path(nea_version, phl_version, snapshot_dir=None):
+    return os.path.join(snapshot_dir or SNAPSHOT_DIR, 'derived', 'join',
+                        f'nea-{nea_version}-phl-{phl_version}.parquet')
+
+
+def load_or_build(planets, phl, nea_version=None, phl_version=None, snapshot_dir=None):
+    """Join index for these catalogs, read from disk or built once.
+
+    With both snapshot versions known the index is persisted for that pair
+    (and the last one read kept in memory); otherwise it is kept in memory
+    for as long as the same frames are used.
+    """
+    if nea_version is not None and phl_version is not None:
+        path = index_path(nea_version, phl_version, snapshot_dir)
+        cached = _built.get('persisted')
+        if cached is not None and cached[0] == path and len(cached[1].phl_rows) == len(planets):
+            return cached[1]
+        index = JoinIndex.load(path) if os.path.exists(path) else None
+        if index is None or len(index.phl_rows) != len(planets):
+            index = JoinIndex.build(planets['pl_name'], phl['P_NAME'])
+            index.save(path)
+        _built['persisted'] = (path, index)
+        return index
+
+    cached = _built.get('nea-phl')
+    if cached is not None and cached[0] is planets and cached[1] is phl:
+        return cached[2]
+    index = JoinIndex.build(planets['pl_name'], phl['P_NAME'])
+    _built['nea-phl'] = (planets, phl, index)
+    return index
@@ -0,0 +1,118 @@
+"""Process-wide cache for the catalog files read by the WebApp.
+
+Both CSV catalogs and their Parquet snapshots (see ``exoplanets.snapshot``)
+go through ``load_catalog``.
+
+Streamlit re-executes the whole script on every interaction, so reading the
+catalogs at module level means a full download + parse per click. Frames
+loaded here are parsed once per process and shared by every session: callers
+must treat them as read-only and ``.copy()`` before mutating.
+
+An entry is trusted for ``ttl`` seconds. Once it is older than that, the
+source version (HTTP ``ETag``/``Last-Modified`` or file mtime and size) is
+checked again and the file is only re-read if it actually changed.
+"""
+import os
+import threading
+import time
+import urllib.request
+
+import pandas as pd
+
+DEFAULT_TTL = 3600
+HEAD_TIMEOUT = 5
+
+_entries = {}
+_locks = {}
+_registry_lock = threading.Lock()
+
+
+class _Entry:
+    __slots__ = ('version', 'checked_at', 'frame')
+
+    def __init__(self, version, frame):
+        self.version = version
+        self.checked_at = time.monotonic()
+        self.frame = frame
+
+
+def is_remote(source):
+    return str(source).startswith(('http://', 'https://'))
+
+
+def source_version(source, timeout=HEAD_TIMEOUT):
+    """Return a cheap token that changes whenever the source content changes.
+
+    ``None`` means the version could not be determined (e.g. the server is
+    unreachable or sends no validator).
+    """
+    if is_remote(source):
+        request = urllib.request.Request(source, method='HEAD')
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.headers.get('ETag') or response.headers.get('Last-Modified')
+        except OSError:
+            return None
+    stat = os.stat(source)
+    return f'{stat.st_mtime_ns}-{stat.st_size}'
+
+
+def _read(source, **read_kwargs):
+    if str(source).endswith('.parquet'):
+        return pd.read_parquet(source, **read_kwargs)
+    return pd.read_csv(source, **read_kwargs)
+
+
+def _key(source, read_kwargs):
+    return str(source), tuple(sorted((k, repr(v)) for k, v in read_kwargs.items()))
+
+
+def _lock_for(key):
+    with _registry_lock:
+        return _locks.setdefault(key, threading.Lock())
+
+
+def load_catalog(source, ttl=DEFAULT_TTL, **read_kwargs):
+    """Return the parsed catalog at ``source``, reading it at most once per version.
+
+    Extra keyword arguments are passed to ``pd.read_csv`` (or
+    ``pd.read_parquet`` for ``.parquet`` files) and are part of the cache
+    key. Concurrent callers asking for the same source wait on a single read
+    instead of each parsing their own copy.
+    """
+    key = _key(source, read_kwargs)
+    entry = _entries.get(key)
+    if entry is not None and time.monotonic() - entry.checked_at < ttl:
+        return entry.frame
+
+    with _lock_for(key):
+        # another session may have refreshed it while we were waiting
+        entry = _entries.get(key)
+        if entry is not None and time.monotonic() - entry.checked_at < ttl:
+            return entry.frame
+
+        version = source_version(source)
+        if entry is not None and (version is None or version == entry.version):
+            # unchanged, or upstream unreachable: keep serving what we have
+            entry.checked_at = time.monotonic()
+            return entry.frame
+
+        frame = _read(source, **read_kwargs)
+        _entries[key] = _Entry(version, frame)
+        return frame
+
+
+def catalog_version(source):
+    """Version token of the cached copy of ``source``, or ``None`` if not loaded."""
+    for (cached_source, _), entry in list(_entries.items()):
+        if cached_source == str(source):
+            return entry.version
+    return None
+
+
+def invalidate(source=None):
+    """Drop cached frames for ``source``, or every cached frame if omitted."""
+    with _registry_lock:
+        for key in list(_entries):
+            if source is None or key[0] == str(source):
+                del _entries[key]
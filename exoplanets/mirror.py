@@ -0,0 +1,172 @@
+"""Local mirror of the remote catalogs and images used by the WebApp.
+
+Pages used to read the PHL catalog and their images from external hosts on
+the request path, so a slow upstream stalled the page. A background thread
+now fetches every remote source concurrently into ``MIRROR_DIR`` (an
+asyncio loop, each blocking request in a worker thread and bounded by
+``TIMEOUT``), then again every ``REFRESH`` seconds. Refreshes are
+conditional requests (``If-None-Match``/``If-Modified-Since``), so
+unchanged sources are not downloaded again.
+
+Pages ask ``resolve(url)`` for the local copy and get the URL itself until
+the first fetch succeeded: a failed fetch never removes a copy already
+mirrored. ``fetch_all`` can be pointed at any server, a local stand-in
+included::
+
+    python -m exoplanets.mirror http://127.0.0.1:8000/phl.csv --mirror-dir /tmp/mirror
+
+``EXOPLANET_MIRROR=0`` disables the background fetches.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from exoplanets.snapshot import SNAPSHOT_DIR
+
+MIRROR_DIR = os.environ.get('EXOPLANET_MIRROR_DIR', os.path.join(SNAPSHOT_DIR, 'mirror'))
+ENABLED = os.environ.get('EXOPLANET_MIRROR', '1') != '0'
+# seconds
+TIMEOUT = float(os.environ.get('EXOPLANET_MIRROR_TIMEOUT', 10))
+REFRESH = float(os.environ.get('EXOPLANET_MIRROR_REFRESH', 3600))
+CONCURRENCY = 8
+
+UPDATED, UNCHANGED, FAILED = 'updated', 'unchanged', 'failed'
+
+logger = logging.getLogger(__name__)
+_started = set()
+_lock = threading.Lock()
+
+
+def local_path(url, mirror_dir=None):
+    """Mirror file of ``url``: its file name, prefixed by a hash of the whole URL."""
+    name = os.path.basename(url.split('?', 1)[0]) or 'index'
+    name = re.sub(r'[^\w.\-]', '_', name)
+    digest = hashlib.sha1(url.encode()).hexdigest()[:12]
+    return os.path.join(mirror_dir or MIRROR_DIR, f'{digest}-{name}')
+
+
+def _meta_path(path):
+    return path + '.json'
+
+
+def read_meta(url, mirror_dir=None):
+    """Validators and fetch time of the mirrored ``url``, or ``None`` if not mirrored."""
+    try:
+        with open(_meta_path(local_path(url, mirror_dir))) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def resolve(url, mirror_dir=None):
+    """Local copy of ``url`` when it was mirrored, ``url`` itself otherwise."""
+    path = local_path(url, mirror_dir)
+    return path if os.path.exists(path) else url
+
+
+def fetch(url, mirror_dir=None, timeout=TIMEOUT):
+    """Fetch ``url`` into the mirror, conditionally if a copy exists; blocking."""
+    path = local_path(url, mirror_dir)
+    meta = read_meta(url, mirror_dir) if os.path.exists(path) else None
+    headers = {}
+    if meta and meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta and meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as response:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write then rename, so pages never read a half-written file
+            with open(path + '.tmp', 'wb') as f:
+                while True:
+                    block = response.read(1 << 20)
+                    if not block:
+                        break
+                    f.write(block)
+            os.replace(path + '.tmp', path)
+            meta = {'url': url, 'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')}
+            status = UPDATED
+    except urllib.error.HTTPError as error:
+        if error.code != 304 or meta is None:
+            logger.warning('could not mirror %s: %s', url, error)
+            return FAILED
+        status = UNCHANGED
+    except OSError as error:
+        logger.warning('could not mirror %s: %s', url, error)
+        return FAILED
+
+    meta['fetched_at'] = time.time()
+    with open(_meta_path(path), 'w') as f:
+        json.dump(meta, f)
+    return status
+
+
+async def fetch_all(urls, mirror_dir=None, timeout=TIMEOUT, concurrency=CONCURRENCY):
+    """Fetch every URL of ``urls`` concurrently; returns the status of each one."""
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(url):
+        async with slots:
+            try:
+                # the request has its own timeout too, this one bounds the whole transfer
+                return await asyncio.wait_for(loop.run_in_executor(None, fetch, url, mirror_dir, timeout),
+                                              timeout * 3)
+            except asyncio.TimeoutError:
+                logger.warning('could not mirror %s: timed out', url)
+                return FAILED
+
+    urls = list(dict.fromkeys(urls))
+    return dict(zip(urls, await asyncio.gather(*(fetch_one(url) for url in urls))))
+
+
+def refresh(urls, mirror_dir=None, timeout=TIMEOUT):
+    """``fetch_all`` from synchronous code."""
+    return asyncio.run(fetch_all(urls, mirror_dir, timeout))
+
+
+def start(urls, mirror_dir=None, interval=REFRESH):
+    """Mirror ``urls`` in a background thread, now and every ``interval`` seconds.
+
+    Only the first call per mirror directory starts a thread.
+    """
+    mirror_dir = mirror_dir or MIRROR_DIR
+    with _lock:
+        if not ENABLED or mirror_dir in _started:
+            return
+        _started.add(mirror_dir)
+
+    def run():
+        while True:
+            refresh(urls, mirror_dir)
+            time.sleep(interval)
+
+    threading.Thread(target=run, name='mirror', daemon=True).start()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch remote catalogs and images into the local mirror.")
+    parser.add_argument('urls', nargs='*', help="URLs to mirror, those of the WebApp by default")
+    parser.add_argument('--mirror-dir', default=MIRROR_DIR)
+    parser.add_argument('--timeout', type=float, default=TIMEOUT, help="seconds")
+    args = parser.parse_args(argv)
+
+    if not args.urls:
+        from exoplanets.pages import REMOTE_SOURCES
+        args.urls = REMOTE_SOURCES
+    for url, status in refresh(args.urls, args.mirror_dir, args.timeout).items():
+        print(f'{status:9} {url} -> {local_path(url, args.mirror_dir)}')
+
+
+if __name__ == '__main__':
+    main()
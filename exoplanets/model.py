@@ -0,0 +1,292 @@
+"""Train-once habitability model and its on-disk registry.
+
+The model used to be fitted on every visit of the ML page. It is now trained
+offline (or on the first request for a new catalog version), saved together
+with its fitted ``FeaturePipeline``, and loaded once per process::
+
+    python -m exoplanets.model --nea planets.csv
+
+Artifacts are keyed by the hash of the labeled rows they were trained on, so
+a model is only retrained when those change: newly discovered planets, which
+have no PHL rating yet, do not invalidate it.
+
+Artifacts trained offline also hold ``BOOTSTRAP`` copies of the classifier,
+same objective and parameters, fitted in parallel on bootstrap resamples of
+the labeled rows (within each class). They only give confidence intervals,
+on request: the predicted class and probability always come from the main
+classifier, in one pass, so ranking costs a single predict. A model trained
+on a page request has no copies yet; ``ensemble_in_background`` adds them
+(and the page serves the main model alone meanwhile).
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import xgboost
+from xgboost import XGBClassifier
+
+from exoplanets.features import TARGET, FeaturePipeline
+from exoplanets.snapshot import SNAPSHOT_DIR, dataset_hash, load_snapshot
+
+MODEL_DIR = os.environ.get('EXOPLANET_MODEL_DIR', os.path.join(SNAPSHOT_DIR, 'models'))
+# bumped whenever the artifact layout changes, older artifacts are retrained
+ARTIFACT_FORMAT = 6
+BOOTSTRAP = int(os.environ.get('EXOPLANET_BOOTSTRAP', 8))
+CONFIDENCE = 0.9
+# parameters of the classifier and of its bootstrap copies
+PARAMS = {}
+
+logger = logging.getLogger(__name__)
+_loaded = {}
+_training_versions = {}
+_lock = threading.Lock()
+# dataset versions whose ensemble is trained by a background thread of this process
+_running = set()
+_running_lock = threading.Lock()
+# training rows of the worker process, set by _init_worker
+_features = None
+_target = None
+
+
+def training_version(planets, snapshot=None):
+    """Hash of the labeled rows of ``planets``, memoized per snapshot version.
+
+    Columns are hashed in name order: snapshot frames group the shared
+    numeric columns first, CSV reads keep the file's order.
+    """
+    version = _training_versions.get(snapshot) if snapshot is not None else None
+    if version is None:
+        labeled = planets[planets[TARGET].notna()]
+        version = dataset_hash(labeled[sorted(labeled.columns)])
+        if snapshot is not None:
+            _training_versions[snapshot] = version
+    return version
+
+
+def _init_worker(features, target):
+    global _features, _target
+    _features, _target = features, target
+
+
+def _fit_resample(seed):
+    # resampled within each class, so that every copy sees every class
+    rng = np.random.default_rng(seed)
+    rows = np.concatenate([rng.choice(members, len(members))
+                           for members in (np.flatnonzero(_target == label) for label in np.unique(_target))])
+    # single-threaded: the parallelism comes from the pool, and n_jobs does not change the model
+    return XGBClassifier(**PARAMS, n_jobs=1).fit(_features[rows], _target[rows])
+
+
+def train_ensemble(features, target, size=BOOTSTRAP, workers=None):
+    """``size`` copies of the classifier fitted on bootstrap resamples, in parallel."""
+    if not size or len(np.unique(target)) < 2:
+        return []
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(features, target)) as pool:
+        return list(pool.map(_fit_resample, range(size)))
+
+
+def train(planets, dataset_version, bootstrap=BOOTSTRAP):
+    """Fit the classifier on the labeled planets and return the model artifact.
+
+    ``bootstrap`` is the size of the ensemble giving the confidence intervals.
+    """
+    labeled = planets[planets[TARGET].notna()]
+    pipeline = FeaturePipeline().fit(labeled)
+    features = pipeline.transform(labeled)
+    model = XGBClassifier(**PARAMS).fit(features, labeled[TARGET])
+    ensemble = train_ensemble(features.to_numpy(), labeled[TARGET].to_numpy(), bootstrap)
+    return {'format': ARTIFACT_FORMAT,
+            'model': model,
+            'ensemble': ensemble,
+            'pipeline': pipeline,
+            'dataset_version': dataset_version,
+            'trained_at': time.time(),
+            'xgboost_version': xgboost.__version__}
+
+
+def with_ensemble(artifact, planets, size=BOOTSTRAP, workers=None):
+    """Copy of ``artifact`` with a bootstrap ensemble of ``size``, fitted on the labeled ``planets``."""
+    labeled = planets[planets[TARGET].notna()]
+    features = artifact['pipeline'].transform(labeled).to_numpy()
+    return {**artifact, 'ensemble': train_ensemble(features, labeled[TARGET].to_numpy(), size, workers)}
+
+
+def predict_proba(artifact, planets, interval=False, confidence=CONFIDENCE):
+    """Predicted class, habitable probability and, on request, its confidence interval, per row.
+
+    The class and probability come from the main classifier, in one pass
+    over features computed once for the whole batch. With ``interval`` and
+    a bootstrap ensemble, each copy makes one more pass: ``low`` and
+    ``high`` are the probability minus and plus the ``confidence`` quantile
+    of the copies' distance to it. Otherwise the bounds are NaN.
+    """
+    features = artifact['pipeline'].transform(planets).to_numpy()
+    model = artifact['model']
+    probabilities = model.predict_proba(features)
+    probability = probabilities[:, model.classes_ > 0].sum(axis=1)
+    scores = pd.DataFrame({'prediction': model.classes_[probabilities.argmax(axis=1)],
+                           'probability': probability, 'low': np.nan, 'high': np.nan}, index=planets.index)
+
+    ensemble = artifact.get('ensemble')
+    if interval and ensemble and len(planets):
+        # (booster, planet)
+        samples = np.stack([booster.predict_proba(features)[:, booster.classes_ > 0].sum(axis=1)
+                            for booster in ensemble])
+        spread = np.quantile(np.abs(samples - probability), confidence, axis=0)
+        scores['low'] = np.clip(probability - spread, 0, 1)
+        scores['high'] = np.clip(probability + spread, 0, 1)
+    return scores
+
+
+def predict(artifact, planets):
+    """Predicted ``P_HABITABLE`` class for each row of ``planets``."""
+    return predict_proba(artifact, planets)['prediction'].to_numpy()
+
+
+def habitable_probability(artifact, planets):
+    """Probability that each row of ``planets`` is habitable, whatever the class."""
+    return predict_proba(artifact, planets)['probability'].to_numpy()
+
+
+def model_version(artifact, interval=False):
+    """Identifies the predictions of ``artifact``: its dataset version and format.
+
+    With ``interval``, also the size of the ensemble giving the bounds.
+    """
+    version = f"{artifact['dataset_version']}.{artifact['format']}"
+    return f"{version}.{len(artifact['ensemble'])}" if interval else version
+
+
+def artifact_path(dataset_version, model_dir=None):
+    return os.path.join(model_dir or MODEL_DIR, f'habitability-{dataset_version}.pkl')
+
+
+def metadata_path(dataset_version, model_dir=None):
+    return os.path.join(model_dir or MODEL_DIR, f'habitability-{dataset_version}.json')
+
+
+def save(artifact, model_dir=None):
+    """Pickle ``artifact``, then write its metadata sidecar, read by ``list_versions``."""
+    model_dir = model_dir or MODEL_DIR
+    os.makedirs(model_dir, exist_ok=True)
+    path = artifact_path(artifact['dataset_version'], model_dir)
+    with open(path + '.tmp', 'wb') as f:
+        pickle.dump(artifact, f)
+    os.replace(path + '.tmp', path)
+
+    metadata = metadata_path(artifact['dataset_version'], model_dir)
+    with open(metadata + '.tmp', 'w') as f:
+        json.dump({'dataset_version': artifact['dataset_version'], 'format': artifact['format'],
+                   'ensemble': len(artifact['ensemble']), 'trained_at': artifact['trained_at'],
+                   'xgboost_version': artifact['xgboost_version']}, f, indent=1)
+    os.replace(metadata + '.tmp', metadata)
+    return path
+
+
+def load(dataset_version, model_dir=None):
+    """Saved artifact for ``dataset_version``, or ``None`` if it must be (re)trained."""
+    try:
+        with open(artifact_path(dataset_version, model_dir), 'rb') as f:
+            artifact = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    return artifact if artifact.get('format') == ARTIFACT_FORMAT else None
+
+
+def list_versions(model_dir=None):
+    """Dataset versions with a saved model that ``load`` accepts, oldest first.
+
+    Only the metadata sidecars are read, not the models. Artifacts of an
+    older format, or saved before the sidecars existed, are skipped: they
+    would be retrained, not used.
+    """
+    versions = []
+    for path in sorted(glob.glob(metadata_path('*', model_dir)), key=os.path.getmtime):
+        with open(path) as f:
+            metadata = json.load(f)
+        if metadata.get('format') == ARTIFACT_FORMAT and os.path.exists(
+                artifact_path(metadata['dataset_version'], model_dir)):
+            versions.append(metadata['dataset_version'])
+    return versions
+
+
+def load_or_train(planets, snapshot=None, model_dir=None):
+    """Model artifact for this catalog, memoized per process.
+
+    Loads the saved artifact matching the labeled rows of ``planets``, and
+    only trains (and saves) a new one when none exists yet, without its
+    bootstrap ensemble (see ``ensemble_in_background``). ``snapshot`` is the
+    catalog snapshot version, used to avoid rehashing the same catalog.
+    """
+    dataset_version = training_version(planets, snapshot)
+    artifact = _loaded.get(dataset_version)
+    if artifact is not None:
+        return artifact
+
+    with _lock:
+        artifact = _loaded.get(dataset_version)
+        if artifact is None:
+            artifact = load(dataset_version, model_dir)
+        if artifact is None:
+            artifact = train(planets, dataset_version, bootstrap=0)
+            save(artifact, model_dir)
+        _loaded[dataset_version] = artifact
+    return artifact
+
+
+def ensemble_in_background(planets, snapshot=None, model_dir=None):
+    """Add the bootstrap ensemble to the saved model in a background thread, once per catalog version."""
+    dataset_version = training_version(planets, snapshot)
+    with _running_lock:
+        if dataset_version in _running:
+            return
+        _running.add(dataset_version)
+
+    def run():
+        try:
+            artifact = load_or_train(planets, snapshot, model_dir)
+            if artifact['ensemble'] or not BOOTSTRAP:
+                return
+            artifact = with_ensemble(artifact, planets, BOOTSTRAP)
+            save(artifact, model_dir)
+            with _lock:
+                _loaded[dataset_version] = artifact
+        except Exception:
+            logger.exception('bootstrap ensemble of dataset %s failed', dataset_version)
+            # let a later visit try again
+            with _running_lock:
+                _running.discard(dataset_version)
+
+    threading.Thread(target=run, name='bootstrap-ensemble', daemon=True).start()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train and save the habitability model.")
+    parser.add_argument('--nea', default='planets.csv',
+                        help="NEA catalog CSV, used when no 'nea' snapshot was ingested")
+    parser.add_argument('--model-dir', default=MODEL_DIR)
+    parser.add_argument('--force', action='store_true', help="retrain even if a model exists")
+    args = parser.parse_args(argv)
+
+    planets = load_snapshot('nea', args.nea)
+    version = training_version(planets)
+    artifact = None if args.force else load(version, args.model_dir)
+    if artifact is not None and (artifact['ensemble'] or not BOOTSTRAP):
+        print(f'model for dataset {version} already trained: {artifact_path(version, args.model_dir)}')
+        return
+    # a model trained by the WebApp only lacks its ensemble
+    artifact = with_ensemble(artifact, planets) if artifact is not None else train(planets, version)
+    path = save(artifact, args.model_dir)
+    print(f'model for dataset {version} saved to {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Registry of the WebApp pages, imported on first use.
+
+Each page is a module exposing ``TITLE`` and ``render(show)``. Only the page
+selected in the sidebar is imported, so a worker never pays for the
+dependencies (XGBoost, the PHL catalog, ...) of pages nobody opened. Import
+times are recorded and logged against ``IMPORT_BUDGET`` the first time each
+module is loaded.
+
+The remote catalog and images the pages use are listed here too, for the
+local mirror (``exoplanets.mirror``) started by the main script.
+"""
+import importlib
+import logging
+import os
+import time
+
+PAGES = {
+    "Accueil": 'exoplanets.pages.accueil',
+    "Observer les Exoplanètes": 'exoplanets.pages.observer',
+    "Les Exoplanètes habitables": 'exoplanets.pages.habitables',
+    "L'IA à l'aide des Astrophysicien": 'exoplanets.pages.ia',
+}
+TITLES = tuple(PAGES)
+
+PHL_CATALOG = 'http://www.hpcf.upr.edu/~abel/phl/hec2/database/phl_exoplanet_catalog.csv'
+IMAGES = {
+    'exoplanet': 'https://i.pinimg.com/originals/b8/d2/bf/b8d2bfc3b9b5cd3224cfe8bda2c928f3.jpg',
+    'pandas': 'https://datapresta.s3.eu-west-3.amazonaws.com/Assets/tool_pandas.png',
+    'transit': 'https://raw.githubusercontent.com/MickaelKohler/Exoplanet_Discovery/main/Ressources/Astronomical_Transit.gif',
+    'habitable_zone': 'https://cdn.shopify.com/s/files/1/0077/5192/5837/files/zone_habitable_systeme_solaire_espace_stellaire_1024x1024.jpg?v=1587994956',
+}
+REMOTE_SOURCES = (PHL_CATALOG,) + tuple(IMAGES.values())
+
+# seconds
+IMPORT_BUDGET = float(os.environ.get('EXOPLANET_IMPORT_BUDGET', 3.0))
+
+import_times = {}
+logger = logging.getLogger(__name__)
+
+
+def record_import(name, seconds):
+    """Record the import time of ``name``, the first measure only, and log it."""
+    if name in import_times:
+        return
+    import_times[name] = seconds
+    total = sum(import_times.values())
+    log = logger.warning if total > IMPORT_BUDGET else logger.info
+    log('imported %s in %.2fs (%.2fs of %.2fs budget)', name, seconds, total, IMPORT_BUDGET)
+
+
+def load_page(title):
+    """Page module for ``title``, importing it on first use."""
+    module = PAGES[title]
+    started = time.perf_counter()
+    page = importlib.import_module(module)
+    record_import(module, time.perf_counter() - started)
+    return page
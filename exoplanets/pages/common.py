@@ -0,0 +1,99 @@
+"""Catalog access, figure caching and profiled output shared by the pages."""
+import streamlit as st
+
+from exoplanets.derived import CUBE_COLUMNS, load_or_build
+from exoplanets.figures import figure_cache
+from exoplanets.loader import catalog_version
+from exoplanets.mirror import resolve
+from exoplanets.pages import IMAGES, PHL_CATALOG
+from exoplanets.profiles import PROFILE_COLUMNS
+from exoplanets.profiling import section
+from exoplanets.snapshot import load_snapshot, snapshot_version
+from exoplanets.tables import PAGE_SIZE
+
+# modifier selon la localisation de la BD
+phl_db = PHL_CATALOG
+nea_db = 'planets.csv'
+
+
+# parsed once per process and shared by every session: do not mutate in place.
+# Pages declare the columns they read, only those are loaded from the snapshots
+# (`python -m exoplanets.snapshot nea=... phl=...`, CSV fallback otherwise)
+def load_planets(columns=None):
+    with section('load nea'):
+        return load_snapshot('nea', nea_db, columns)
+
+
+def load_plan_hab(columns=None):
+    with section('load phl'):
+        return load_snapshot('phl', resolve(phl_db), columns)
+
+
+# discovery counts by (disc_year, discoverymethod, telescope_group, disc_locale)
+def load_cube():
+    with section('load discovery_cube'):
+        return load_or_build('nea', 'discovery_cube', lambda: load_planets(CUBE_COLUMNS))
+
+
+# planets by star type, planet type, star age group and habitability
+def load_profiles():
+    with section('load habitability_profile'):
+        return load_or_build('phl', 'habitability_profile', lambda: load_plan_hab(PROFILE_COLUMNS))
+
+
+def data_version():
+    return tuple(snapshot_version(name) or catalog_version(source)
+                 for name, source in (('nea', nea_db), ('phl', resolve(phl_db))))
+
+
+# figures only depend on the data, not on the 'Montre moi la data' option:
+# toggling it or coming back to a page reuses the figures already built
+def cached_figure(page, chart, build):
+    with section(f'figure {chart}'):
+        return figure_cache.get_or_build((page, chart, data_version()), build)
+
+
+# sending charts and tables to the browser is timed too (`exoplanets.profiling`),
+# ``target`` being a column or an expander rather than the main area
+def plotly_chart(fig, chart, target=st):
+    with section(f'plotly_chart {chart}'):
+        target.plotly_chart(fig, use_container_width=True)
+
+
+# images come from the local mirror once fetched, from their host until then
+def image(name, target=st, **kwargs):
+    target.image(resolve(IMAGES[name]), **kwargs)
+
+
+def dataframe(data, table, target=st, **kwargs):
+    with section(f'dataframe {table}'):
+        target.dataframe(data, **kwargs)
+
+
+# filters, sort and pagination run on the server (`exoplanets.tables`), only the
+# rows of the current page are sent; ``hidden`` columns are shown blank
+def paged_table(table, name, filters=(), ranges=(), hidden=(), page_size=PAGE_SIZE, target=st, height=550):
+    chosen = {}
+    for column in filters:
+        accepted = target.multiselect(column, table.options(column), key=f'{name}-{column}')
+        if accepted:
+            chosen[column] = accepted
+    for column in ranges:
+        low, high = (int(v) for v in table.bounds(column))
+        if low < high:
+            chosen[column] = target.slider(column, low, high, (low, high), key=f'{name}-{column}')
+
+    sortable = [c for c in table.frame.columns if c not in hidden]
+    sort = target.selectbox('Trier par', [None] + sortable, key=f'{name}-sort',
+                            format_func=lambda c: '—' if c is None else c)
+    ascending = not target.checkbox('Ordre décroissant', key=f'{name}-descending')
+
+    with section(f'query {name}'):
+        total = int(table.mask(chosen).sum())
+        pages = max((total - 1) // page_size + 1, 1)
+        page = target.number_input(f'Page (sur {pages})', 1, pages, 1, key=f'{name}-page') - 1
+        rows, total = table.query(chosen, sort, ascending, page, page_size)
+        if hidden:
+            rows = rows.assign(**{column: ' ' for column in hidden})
+    dataframe(rows, name, target, height=height)
+    target.caption(f'{page * page_size + min(len(rows), 1)}–{page * page_size + len(rows)} sur {total}')
@@ -0,0 +1,319 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from exoplanets import astro
+from exoplanets import join
+from exoplanets import plotting
+from exoplanets.pages.common import (cached_figure, dataframe, image, load_plan_hab, load_planets, load_profiles,
+                                     plotly_chart)
+from exoplanets.profiles import PLANET_TYPES, STAR_TYPES, age_labels, profile
+from exoplanets.profiling import section
+from exoplanets.snapshot import snapshot_version
+
+TITLE = "Les Exoplanètes habitables"
+COLUMNS = ['pl_name', 'hostname', 'sy_dist', 'P_HABITABLE', 'S_CONSTELLATION']
+PHL_COLUMNS = ['P_NAME']
+HZ_COLUMNS = ['pl_name', 'P_HABITABLE'] + astro.INPUT_COLUMNS
+# S⊕ and kelvins
+FLUX_RANGE = (0, 3)
+TEFF_RANGE = (2500, 7500)
+
+
+def render(show):
+    st.title('Les caractéristiques des Exoplanètes habitables')
+    st.subheader('Où sont elles et quels sont leurs projets')
+    
+    planets = load_planets(COLUMNS)
+    phl_sample = load_plan_hab(PHL_COLUMNS)
+    with section('merge'):
+        phl_index = join.load_or_build(planets, phl_sample, snapshot_version('nea'), snapshot_version('phl'))
+        zone_hab = phl_index.join(planets, phl_sample)
+
+    st.markdown(
+        """
+        On dénombre dans la base de données plus de *** exoplanètes et seulement *** qui sont considérées 
+        comme pouvant potentiellement habriter la vie.
+        """
+    )
+
+    # planètes notées par le PHL mais introuvables dans son catalogue, même après normalisation des noms
+    missing = phl_index.unmatched(planets)
+    if missing:
+        st.caption(f"{len(missing)} exoplanètes notées par le PHL sont absentes de son catalogue : "
+                   + ', '.join(missing[:10]) + ('…' if len(missing) > 10 else ''))
+
+    def constellations_chart():
+        # réparition des planètes
+        constelation = planets[planets['P_HABITABLE'].isin([1, 2])][['pl_name', 'hostname', 'S_CONSTELLATION']]
+        constelation.dropna(inplace=True)
+        fig = px.sunburst(constelation, path=['S_CONSTELLATION', 'hostname', 'pl_name'], maxdepth=2,
+                          color_discrete_sequence=px.colors.sequential.Peach_r)
+        fig.update_layout(title="<b>Où sont localisées les planètes habitables ?</b>",
+                          margin=dict(l=10, r=10, b=10, t=40))
+        return fig
+
+    fig = cached_figure(TITLE, 'constellations', constellations_chart)
+    col1, col2 = st.beta_columns([3, 1])
+    with col1:
+        plotly_chart(fig, 'constellations')
+    with col2:
+        st.title(" ")
+        st.markdown(
+            """
+            Le tableau interactif ci-contre vous présente la position de l’ensemble des exoplanètes habitables.
+            Vous avez :
+            - _Sur le cercle intérieur_ : les constellations.
+            - _Sur le cercle extérieur_ : les systèmes solaire.
+            
+            Vous pouvez cliquer sur le système pour afficher les noms des exoplanètes habitables qui le composent. 
+            """)
+
+    # distances des seules planètes habitables, sans copier leurs lignes
+    habit_dist = zone_hab['sy_dist'].where(zone_hab['P_HABITABLE'].isin([1, 2]))
+    planet_name = zone_hab.at[habit_dist.idxmin(), 'pl_name']
+    planet_distance = round(habit_dist.min()*3.26156, 2)
+    st.markdown(
+        f"""
+        __Où se situe la planète la plus proche ?__ La planète potentiellement habitables 
+        la plus proche est __{planet_name}__, qui est située à {planet_distance} années lumières.
+
+
+        A savoir, qu'il faudait _76 624 993 ans_ de voyage à la sonde _Voyager 1_ pour atteindre cette exoplanète.
+        
+        Pour qu'une planète soit considéré comme habitable, elle doit être située dans la __Zone Habitable__ 
+        qui est la région de l’espace où les conditions sont favorables à l’apparition de la vie, 
+        telle que nous la connaissons sur Terre.
+        Les limites des zones habitables sont calculées à partir des éléments connus de la biosphère de la Terre, 
+        comme sa position dans le Système solaire et la quantité d'énergie qu'elle reçoit du Soleil.  
+        
+        Le graphique ci-dessous permet de bien percevoir cette _Zone Habitable_, 
+        les exoplanètes devant s'éloigner à mesure que son étoile gagne en puissance.       
+        """
+    )
+
+    def habitable_zone_chart():
+        # zone habitable, calculée depuis les colonnes du NEA pour toutes les planètes,
+        # y compris celles que le PHL n'a pas encore notées
+        catalog = load_planets(HZ_COLUMNS)
+        derived = astro.derived_quantities(catalog, snapshot_version('nea'))
+        zone = plotting.clip(pd.DataFrame({'pl_name': catalog['pl_name'], 'flux': derived['flux'],
+                                           'st_teff': catalog['st_teff'], 'P_HABITABLE': catalog['P_HABITABLE']}),
+                             'flux', 'st_teff', x_range=FLUX_RANGE, y_range=TEFF_RANGE)
+        rating = zone['P_HABITABLE']
+
+        fig = go.Figure()
+        teff = np.linspace(*astro.TEFF_RANGE, 100)
+        for zone_name, (inner, outer) in astro.ZONES.items():
+            dash = 'solid' if zone_name == 'conservative' else 'dash'
+            for limit in (inner, outer):
+                fig.add_trace(go.Scatter(x=astro.hz_flux(teff, limit), y=teff, mode='lines', hoverinfo='skip',
+                                         line=dict(color='seagreen', dash=dash, width=1), showlegend=False))
+        for name, rows, marker in (
+                ('Non notée', rating.isna(), dict(color='lightgray', opacity=0.3)),
+                ('Non Habitable', rating == 0, dict(color='firebrick', opacity=0.3)),
+                ('Habitable', rating > 0, dict(color='lightseagreen'))):
+            points = zone[rows.to_numpy()]
+            fig.add_trace(plotting.trace(points, 'flux', 'st_teff', text=points['pl_name'],
+                                         mode='markers', marker=marker, name=name))
+        fig.update_layout(
+            title='<b>La situation des planètes habitables selon la chaleur du soleil et l\'énergie reçue</b>',
+            yaxis=dict(title="Température du soleil (en kelvins)", range=TEFF_RANGE),
+            xaxis=dict(title="Flux reçu de l'étoile (Terre = 1)", range=FLUX_RANGE[::-1]),
+            margin=dict(l=10, r=10, b=10, t=70))
+        return fig
+
+    fig = cached_figure(TITLE, 'habitable_zone', habitable_zone_chart)
+    plotly_chart(fig, 'habitable_zone')
+
+    expander = st.beta_expander("Illustration de la zone habitable dans notre système solaire")
+    image('habitable_zone', expander)
+
+    st.markdown("---")
+    
+    # Comparatif Habitable/inhabitable
+    st.subheader("Qu'est ce qui caractérise une planète habitable ?")
+    st.markdown(
+        """
+        La _Zone Habitable_ met en avant la nécessité de déterminer les critères 
+        qui font qu’une exoplanète soit suspectée comme pouvant être habitable. 
+
+       On peut donc tenter de comparer les caractéristiques des exoplanètes 
+        considérées comme habitables de l’ensemble des exoplanètes.
+        Restons dans les étoiles et essayons de répondre à la question : 
+        _Quelle type d’étoile favorise la présence d’exoplanètes habitables ?_
+        """
+    )
+
+    # profils en pourcents, précalculés à l'ingestion du catalogue PHL
+    profiles = load_profiles()
+
+    # Sun Type
+    with section('table star_types'):
+        sType_tab = profile(profiles, 'S_TYPE_TEMP', STAR_TYPES)
+
+    def star_type_chart():
+        fig = px.bar(sType_tab, x=sType_tab.index, y=["Exoplanètes", "Habitables"], barmode='group',
+                     title="<b>La répartition des exoplanètes selon le type de leur étoile</b> (en pourcents)",
+                     color_discrete_map={'Exoplanètes': 'darkblue', 'Habitables': 'crimson'})
+        fig.update_traces(texttemplate='%{text}%', textposition='outside')
+        fig.update_layout(showlegend=True, font_family='IBM Plex Sans',
+                          xaxis=dict(title="Catégorie d'étoile"),
+                          yaxis=dict(title=None),
+                          uniformtext_minsize=10,
+                          uniformtext_mode='hide',
+                          margin=dict(l=10, r=10, b=10),
+                          legend=dict(x=0, y=1, traceorder="normal", bgcolor='rgba(0,0,0,0)', font=dict(size=12)))
+        texts = [sType_tab["Exoplanètes"], sType_tab["Habitables"]]
+        for i, t in enumerate(texts):
+            fig.data[i].text = t
+        return fig
+
+    fig = cached_figure(TITLE, 'star_types', star_type_chart)
+    if show:
+        col1, col2 = st.beta_columns([1, 3])
+        with col2:
+            plotly_chart(fig, 'star_types')
+        with col1:
+            st.title(' ')
+            dataframe(sType_tab, 'star_types')
+    else:
+        plotly_chart(fig, 'star_types')
+   
+    col1, col2 = st.beta_columns([1, 2])
+    with col1:
+        st.markdown(
+            """
+            On peut constater que ce sont surtout les étoiles de type K et M qui comprennent 
+            le plus d’exoplanètes habitables. Ce qui s’explique sans doute par 
+            le faite que ce sont les plus petites et donc les moins chaudes. 
+
+            Le tableau ci-contre explique la différence entre chaque type.
+            """)
+
+    with col2:
+        sol_typ = pd.DataFrame(data=[['> 25 000 K', 'bleue', 'azote, carbone, hélium et oxygène'],
+                                     ['10 000–25 000 K', 'bleue-blanche', 'hélium, hydrogène'],
+                                     ['7 500–10 000 K', 'blanche', 'hydrogène'],
+                                     ['6 000–7 500 K', 'jaune-blanche',
+                                      'métaux : fer, titane, calcium, strontium et magnésium'],
+                                     ['5 000–6 000 K', 'jaune (comme le Soleil)',
+                                      'calcium, hélium, hydrogène et métaux'],
+                                     ['3 500–5 000 K', 'orange', 'métaux et monoxyde de titane'],
+                                     ['< 3 500 K', 'rouge', 'métaux et monoxyde de titane']],
+                               index=['O', 'B', 'A', 'F', 'G', 'K', 'M'],
+                               columns=['température', 'couleur conventionnelle', "raies d'absorption"])
+        st.write(sol_typ)
+    
+    # Sun Age
+    with section('table star_ages'):
+        sAge_tab = profile(profiles, 'age_group', age_labels())
+
+    def star_age_chart():
+        fig = px.bar(sAge_tab, x=sAge_tab.index, y=["Exoplanètes", "Habitables"],
+                     title="<b>La répartition des exoplanètes selon l'age de leur étoile</b> (en pourcents)",
+                     barmode='group',
+                     color_discrete_map={'Exoplanètes': 'darkblue', 'Habitables': 'crimson'})
+        fig.update_traces(texttemplate='%{text}%', textposition='outside')
+        fig.update_layout(showlegend=True, font_family='IBM Plex Sans',
+                          xaxis=dict(title="Age de l'étoile (Gy)"),
+                          yaxis=dict(title=None),
+                          uniformtext_minsize=10, uniformtext_mode='hide',
+                          margin=dict(l=10, r=10, b=10),
+                          legend=dict(x=0, y=1, traceorder="normal",
+                                      bgcolor='rgba(0,0,0,0)',
+                                      font=dict(size=12)))
+        texts = [sAge_tab["Exoplanètes"], sAge_tab["Habitables"]]
+        for i, t in enumerate(texts):
+            fig.data[i].text = t
+        return fig
+
+    fig = cached_figure(TITLE, 'star_ages', star_age_chart)
+    if show:
+        col1, col2 = st.beta_columns([3, 1])
+        with col1:
+            plotly_chart(fig, 'star_ages')
+        with col2:
+            st.title(' ')
+            dataframe(sAge_tab, 'star_ages', height=360)
+    else:
+        plotly_chart(fig, 'star_ages')
+
+    st.markdown(
+        """
+        Toujours dans les étoiles, on remarque que les exoplanètes observées sont essentiellement situées 
+        sur les __étoiles les plus jeunes__, même si aucune tranche d’âge ne sort du lot. 
+
+        Pour que la vie puisse apparaître sur une planète, il ne suffit pas qu'elle soit dans l'écosphère de son 
+        étoile ; son système planétaire doit se situer __assez près du centre de la galaxie__ pour avoir suffisamment 
+        d'éléments lourds qui favorisent la formation de planètes telluriques et des 
+        atomes nécessaires à la vie (fer, cuivre, etc).
+        Mais ce système devra également se situer __assez loin du centre galactique__ pour éviter des dangers tels que 
+        le trou noir au centre de la galaxie et les supernova.
+        Mais l'exoplanète en elle même doit présenter des conditions intrinsèque pour 
+        être une bonne candidate pour accueillir la vie. 
+        """
+    )
+
+    # Exoplanet type
+    with section('table planet_types'):
+        pType_tab = profile(profiles, 'P_TYPE', PLANET_TYPES)
+
+    def planet_type_chart():
+        fig = px.bar(pType_tab,
+                     x=pType_tab.index,
+                     y=["Exoplanètes", "Habitables"],
+                     title="<b>La répartition des exoplanètes selon leur type</b> (en pourcents)",
+                     barmode='group',
+                     color_discrete_map={'Exoplanètes': 'darkblue', 'Habitables': 'crimson'})
+        fig.update_traces(texttemplate='%{text}%', textposition='outside')
+        fig.update_layout(showlegend=True, font_family='IBM Plex Sans',
+                          xaxis=dict(title="Type d'exoplanète"),
+                          yaxis=dict(title=None),
+                          uniformtext_minsize=10, uniformtext_mode='hide',
+                          margin=dict(l=10, r=10, b=10),
+                          legend=dict(x=0,
+                                      y=1,
+                                      traceorder="normal",
+                                      bgcolor='rgba(0,0,0,0)',
+                                      font=dict(size=12)))
+        texts = [pType_tab["Exoplanètes"], pType_tab["Habitables"]]
+        for i, t in enumerate(texts):
+            fig.data[i].text = t
+        return fig
+
+    fig = cached_figure(TITLE, 'planet_types', planet_type_chart)
+    col1, col2 = st.beta_columns([3, 1])
+    with col1:
+        plotly_chart(fig, 'planet_types')
+    with col2:
+        if show:
+            st.title(" ")
+            dataframe(pType_tab, 'planet_types')
+        else:
+            st.title(" ")
+            st.markdown(
+                """
+                Les type d'exoplanet selon
+                la masse de la terre (MT): 
+                - _Miniterran_ : -0,1 MT
+                - _Subterran_ : 0,1 à 0,5 MT
+                - _Terran_ : 0,5 à 2 MT
+                - _Superterran_ : 2 à 10 MT
+                - _Neptunian_ : 10 à 50 MT
+                - _Jovian_ : +50 MT 
+                """
+            )
+    
+    st.markdown(
+        """
+        Les exoplanète habitables sont essentiellement situées sur des planètes équivalentes 
+        à la terre ou légèrement plus grosse. Comme pour la _Zone Habitable_, la conditions de 
+        validité pour être considérée comme une exoplanète habitable est très restreinte. 
+        Ces conditions ne sont bien sur pas limitatives. Il existe de nombreux critères à prendre en compte. 
+        De nombreuses variables qui peuvent être étudiées par un algorithme afin de 
+        pouvoir créer un modèle permettant de repérer les exoplanètes.
+        """
+    )
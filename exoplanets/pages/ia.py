@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from exoplanets import evaluation
+from exoplanets import model as habitability
+from exoplanets import similarity
+from exoplanets.pages.common import cached_figure, data_version, dataframe, load_planets, paged_table, plotly_chart
+from exoplanets.predictions import get_store
+from exoplanets.profiling import section
+from exoplanets.snapshot import snapshot_version
+from exoplanets.tables import get_table
+
+TITLE = "L'IA à l'aide des Astrophysicien"
+PREDICTION_COLUMNS = ['Prédiction', 'Probabilité (%)', 'Min (%)', 'Max (%)']
+
+
+def render(show):
+    st.title("L'intelligence artificielle à la recherche de la vie")
+    st.subheader("Comment le Machine Learning peut venir à l'aide des Astrophysicien")
+    st.title(" ")
+
+    st.markdown(
+        """
+        Lors de notre recherche de la base de donnée parfaite (BDP), nous avons trouvé une base de donnée 
+        hébergée par _Planetary Hability Laboratory_ qui tente de répertorier et identifier les exoplanètes habitables.
+
+        Toutefois, leur base de donnée ne prend pas en considération les dernières 
+        exoplanètes découvertes à partir de début 2020. 
+        Nous avons donc tenté d’entrainer un __algorithme de Machine Learning__ pour déterminer, 
+        selon les caractéristiques de chaque exoplanète, si elle peut être catégorisée comme habitable ou non, 
+        dans le but de catégoriser celles qui n’ont pas été identifiée.
+        """
+    )
+
+    planets = load_planets()
+
+    # trained offline (`python -m exoplanets.model`) or once per catalog version;
+    # the bootstrap ensemble of a model trained here is added in the background
+    with section('model load_or_train'):
+        artifact = habitability.load_or_train(planets, snapshot_version('nea'))
+    if not artifact['ensemble']:
+        habitability.ensemble_in_background(planets, snapshot_version('nea'))
+
+    # making prediction on planets not yet rated by the PHL,
+    # only new or changed planets actually go through the model.
+    # Ranked by probability of being habitable, with the bootstrap interval once it exists
+    def predictions_table():
+        df_exoplanet_rf_2 = planets[planets['P_HABITABLE'].isna()]
+        with section('model predict'):
+            scores = get_store().score(artifact, df_exoplanet_rf_2, interval=True)
+        predictions = scores['prediction'].to_numpy()
+        table = pd.DataFrame({"Nom de l'Exoplanète": df_exoplanet_rf_2['pl_name'],
+                              'Découverte': df_exoplanet_rf_2['disc_year'],
+                              'Méthode utilisée': df_exoplanet_rf_2['discoverymethod'],
+                              'Prédiction': np.where(predictions == 0, 'Inhabitable', predictions.astype(str)),
+                              'Probabilité (%)': (scores['probability'] * 100).round(1),
+                              'Min (%)': (scores['low'] * 100).round(1),
+                              'Max (%)': (scores['high'] * 100).round(1)})
+        return table.sort_values('Probabilité (%)', ascending=False, kind='mergesort')
+
+    # built once per catalog and model version, shared by every session
+    df_final = get_table(('predictions', data_version(), habitability.model_version(artifact, interval=True)),
+                         predictions_table)
+
+    st.title(' ')
+    ML_off = True
+    col1, col2 = st.beta_columns([1, 3])
+    with col1:
+        st.markdown(
+            """
+            __Cliquez sur le bouton ci-dessous__ pour rechercher de nouvelles planètes 
+            ayant le potentielle d'être habitable. 
+            """
+        )
+        # a checkbox rather than a button: paging through the table reruns the page
+        if st.checkbox('Rechercher la vie'):
+            ML_off = False
+            st.markdown(
+                """
+                Comme vous pouvez le voir, __aucune nouvelle exoplanète ne 
+                remplit les conditions__ pour pouvoir accueillir la vie. 
+
+                La recherche continue…
+                _« I want to believe »_
+                """
+            )
+            if not artifact['ensemble']:
+                st.caption("Les intervalles de confiance (Min, Max) sont en cours de calcul "
+                           "et s'afficheront lors d'une visite suivante.")
+    with col2:
+        paged_table(df_final, 'predictions', filters=['Méthode utilisée'], ranges=['Découverte'],
+                    hidden=PREDICTION_COLUMNS if ML_off else ())
+
+    # planètes habitables connues les plus proches, sur les variables utilisées par le modèle
+    st.subheader("À quelles planètes habitables ressemble-t-elle ?")
+    name = st.text_input("Nom de l'exoplanète (tableau ci-dessus ou zone habitable)", key='similar-name')
+    if name:
+        # built once per catalog and model version, queried in a few milliseconds
+        with section('similarity index'):
+            index = similarity.get_index(planets, artifact, snapshot_version('nea'))
+        try:
+            with section('similarity query'):
+                neighbours = index.similar(name.strip())
+        except KeyError:
+            st.warning(f"{name} ne fait pas partie du catalogue")
+        else:
+            dataframe(neighbours.drop(columns='pl_name').rename(columns={
+                'rank': 'Rang', 'similar': 'Exoplanète habitable', 'P_HABITABLE': 'Habitabilité',
+                'distance': 'Distance'}).set_index('Rang'), 'similar')
+
+    expander = st.beta_expander("Explication du modèle retenu")
+    expander.markdown(
+        """
+        ___Quel modèle a été retenu ?___
+        Nous avons testé les algorithmes de classification les plus 
+        pertinents afin de prédire si une planète est habitable.
+        Lors de ces tests, les algorithmes, ci-dessous, ont produit les résultats les plus proches 
+        de la réalités (scores), c'est à dire en comparant nos résultats aux informations à notre disposition.
+        Bien que les meilleurs scores soient supérieurs à celui du XGBoost, que nous avons choisit, 
+        ce dernier a été plus à même de prédire les planètes habitables connues.
+        Les scores sont mesurés par validation croisée sur la version actuelle du catalogue.
+        """)
+        
+    # cross-validated offline (`python -m exoplanets.evaluation`) or in the background,
+    # never while the page is rendered
+    with section('model evaluation'):
+        scores = evaluation.get_results(planets, snapshot_version('nea'))
+    if scores is None:
+        evaluation.evaluate_in_background(planets, snapshot_version('nea'))
+        expander.info("Les scores de cette version du catalogue sont en cours de calcul, "
+                      "ils s'afficheront lors d'une prochaine visite.")
+    else:
+        dataScore = scores.rename(columns={'accuracy': 'Score',
+                                           'habitable_recall': 'Habitables retrouvées',
+                                           'fit_seconds': 'Entraînement (s)',
+                                           'predict_us_per_row': 'Prédiction (µs/planète)'})
+        dataScore.index.name = 'Test'
+
+        def scores_chart():
+            fig = px.bar(dataScore, x=dataScore.index, y=['Score', 'Habitables retrouvées'], barmode='group',
+                         color_discrete_map={'Score': 'darkblue', 'Habitables retrouvées': 'crimson'},
+                         title="Score des différents test").update_xaxes(categoryorder="total descending")
+
+            fig.update_yaxes(range=[0, 1])
+            fig.update_layout(xaxis_title="Test", yaxis_title="Score", legend_title=None)
+            return fig
+
+        fig = cached_figure(TITLE, 'scores', scores_chart)
+        plotly_chart(fig, 'scores', expander)
+        if show:
+            dataframe(dataScore.round(4), 'scores', expander)
+
+    expander.markdown(
+        """
+        ___Qu'est-ce que le XGBoost ?___
+        XGBoot est la Extrême Gradient Boosted Trees, plus simplement 
+        il s'agit d'une forêt d'arbres de décision optimisée.
+        "Un arbre de décision est un outil d'aide à la décision représentant 
+        un ensemble de choix sous la forme graphique d'un arbre. 
+        Les différentes décisions possibles sont situées aux extrémités des branches (les « feuilles » de l'arbre), 
+        et sont atteintes en fonction de décisions prises à chaque étape" 
+        [source](https://fr.wikipedia.org/wiki/Arbre_de_d%C3%A9cision)
+        """
+    )
@@ -0,0 +1,108 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from exoplanets import plotting
+from exoplanets.pages.common import cached_figure, dataframe, image, load_cube, load_planets, plotly_chart
+from exoplanets.profiling import section
+
+TITLE = "Observer les Exoplanètes"
+COLUMNS = ['discoverymethod', 'sy_disterr1', 'pl_orbper']
+
+
+def render(show):
+    cube = load_cube()
+
+    st.title('Comment découvrir des Exoplanètes')
+    st.subheader("La découverte d'un nouveau Monde")
+
+    st.markdown(
+        """
+        Le 6 octobre 1995, les astronomes Michel Mayor et Didier Queloz, annoncent la découverte d'une première 
+        exoplanète. Cette planète, nommée __51 Pegasi B__, se  situe à une cinquantaine 
+        d'années lumière de la Terre dans la constelation du Pégase.
+        """
+    )
+
+    def discoveries_chart():
+        fig = px.histogram(cube, x="disc_year", y="count", histfunc="sum", color="discoverymethod",
+                           title="<b>Le nombre de planètes découvertes par années et par méthodes</b>",
+                           nbins=10, color_discrete_sequence=px.colors.sequential.Agsunset_r,
+                           labels="Méthode de découverte")
+        fig.update_layout(xaxis_title="Années de découverte", yaxis_title="Nombre d'Exoplanet")
+        return fig
+
+    fig = cached_figure(TITLE, 'discoveries', discoveries_chart)
+    plotly_chart(fig, 'discoveries')
+
+    if show:
+        with section('table discoveries'):
+            df_hist = pd.pivot_table(cube, index='disc_year', values='count', columns='discoverymethod',
+                                     aggfunc='sum', margins=True).fillna(0)
+        dataframe(df_hist, 'discoveries')
+    
+    st.markdown("""
+    ___Qu'est ce que la méthode des vitesses radiales___
+
+    La force de gravité des planètes modifie le déplacement de leur étoile.
+    Les capteurs situés sur Terre vont détecter des spectres passant d'une couleur bleu à une couleur rouge. 
+    Le décalage de temps durant le changement de couleurs permet de déduire des paramètres 
+    physiques comme la vitesse, la masse et la distance.
+    
+    ___Et la méthode la méthode du transit ?___
+    Cette méthode consiste en l'observation d'une répétition constante d'une __variation de luminosité__ d'une étoile.
+    Lorsqu'une planète passe devant une étoiles, elle crée une zone d'ombre 
+    qui font varier la luminosité captée depuis la Terre.
+    """)
+
+    col1, col2, col3 = st.beta_columns([1, 3, 1])
+    with col2:
+        image('transit')
+
+    def methods_chart():
+        planets = load_planets(COLUMNS)
+        # seuls les points visibles sont envoyés au navigateur
+        fig = plotting.scatter(planets, x="sy_disterr1", y="pl_orbper", x_range=[-2, 200], y_range=[0, 200],
+                               title="<b>Les méthodes utilisées en fonction de la période orbitale et de la distance à la Terre</b>",
+                               color='discoverymethod',)
+        fig.update_layout(xaxis_title="Distance à la Terre (al)", yaxis_title="Période orbitale autour de l'étoile")
+        return fig
+
+    fig = cached_figure(TITLE, 'methods', methods_chart)
+    plotly_chart(fig, 'methods')
+
+    st.subheader("La contribution de Kepler dans la recherches d'exoplanètes")
+    st.markdown(
+        """
+        Les méthodes de détection des exoplanètes peuvent être appliquées sur Terre mais aussi directement depuis 
+        l'espace. Elles nécessitent l'utilisation d'équipement spécifiques capable d'enregistrer l'image des spectres 
+        lumineux. Ces équipements peuvent aller du plus pointus aux simple télescope ou appareil photo.
+        """)
+
+    def telescopes_chart():
+        # objectifs photos et telescopes sont déjà groupés dans le cube
+        fig = px.histogram(cube, x="telescope_group", y="count", histfunc="sum", color="discoverymethod",
+                           title="<b>Nombre de planètes détectées par type de téléscope</b>"
+                           ).update_xaxes(categoryorder="total descending")
+
+        fig.update_layout(xaxis_title="Type de telescope",
+                          yaxis_title="Nombre de planètes détéctées",
+                          title_text='Max température par Date en fonction des opinions', title_x=0.5)
+        return fig
+
+    fig = cached_figure(TITLE, 'telescopes', telescopes_chart)
+    col1, col2 = st.beta_columns([2, 1])
+    with col1:
+        plotly_chart(fig, 'telescopes')
+    with col2:
+        st.title('')
+        st.markdown(
+            """
+            En 2009, l'engin spatial Kepler est envoyé en orbite avec l'objectif de 
+            recenser les planètes similaire à la Terre.
+            
+            Il a été conçu pour utiliser la méthode des transits par l'intermédiaire d télescope de 0.98 mètre 
+            de diamètre équipé d'un détecteur mesurant l'intensité lumineuse des étoiles.
+            
+            La mission de Kepler s'est terminée en 2019 après la découverte record de plus de 2600 exoplanètes. 
+            """)
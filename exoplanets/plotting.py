@@ -0,0 +1,60 @@
+"""Scatter plots whose payload does not grow with the catalog.
+
+Points outside the visible range are dropped before the figure is built
+(rather than serialized and hidden by the axis range), traces switch to WebGL
+above ``WEBGL_THRESHOLD`` points, and past ``DENSITY_THRESHOLD`` points the
+scatter is replaced by a heatmap of counts binned on the server.
+"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+WEBGL_THRESHOLD = 1000
+DENSITY_THRESHOLD = 50000
+DENSITY_BINS = 100
+
+
+def clip(frame, x, y, x_range=None, y_range=None):
+    """Rows of ``frame`` with both coordinates set and inside the given ranges."""
+    mask = frame[x].notna().to_numpy() & frame[y].notna().to_numpy()
+    for column, bounds in ((x, x_range), (y, y_range)):
+        if bounds is not None:
+            values = frame[column].to_numpy(dtype=float, na_value=np.nan)
+            mask &= (values >= bounds[0]) & (values <= bounds[1])
+    return frame[mask]
+
+
+def density(frame, x, y, x_range=None, y_range=None, bins=DENSITY_BINS, **layout):
+    """Heatmap of point counts over a ``bins`` x ``bins`` grid."""
+    xs = frame[x].to_numpy(dtype=float)
+    ys = frame[y].to_numpy(dtype=float)
+    bounds = [x_range or (xs.min(), xs.max()), y_range or (ys.min(), ys.max())]
+    counts, x_edges, y_edges = np.histogram2d(xs, ys, bins=bins, range=bounds)
+    fig = go.Figure(go.Heatmap(z=np.where(counts > 0, counts, np.nan).T,
+                               x=(x_edges[:-1] + x_edges[1:]) / 2,
+                               y=(y_edges[:-1] + y_edges[1:]) / 2,
+                               colorscale='Agsunset', colorbar=dict(title='Exoplanètes')))
+    fig.update_layout(**layout)
+    return fig
+
+
+def scatter(frame, x, y, x_range=None, y_range=None, threshold=WEBGL_THRESHOLD,
+            density_threshold=DENSITY_THRESHOLD, **px_kwargs):
+    """``px.scatter`` of the visible points only, in WebGL or as density tiles when large."""
+    data = clip(frame, x, y, x_range, y_range)
+    if density_threshold is not None and len(data) > density_threshold:
+        fig = density(data, x, y, x_range, y_range, title=px_kwargs.get('title'))
+    else:
+        render_mode = 'webgl' if len(data) > threshold else 'svg'
+        fig = px.scatter(data_frame=data, x=x, y=y, render_mode=render_mode, **px_kwargs)
+    if x_range is not None:
+        fig.update_xaxes(range=x_range)
+    if y_range is not None:
+        fig.update_yaxes(range=y_range)
+    return fig
+
+
+def trace(frame, x, y, threshold=WEBGL_THRESHOLD, **kwargs):
+    """``go.Scatter`` trace of ``frame``, or ``go.Scattergl`` above ``threshold`` points."""
+    trace_type = go.Scattergl if len(frame) > threshold else go.Scatter
+    return trace_type(x=frame[x], y=frame[y], **kwargs)
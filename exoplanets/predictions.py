@@ -0,0 +1,94 @@
+"""Persistent store of habitability predictions, keyed by planet name.
+
+Each stored prediction, with its habitable probability and confidence
+interval (see ``model.predict_proba``), remembers the hash of the catalog
+values it was computed from and the model that produced it. ``score`` only
+sends rows whose values changed, or that were never scored, to the boosters;
+everything else is read back from the store.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from exoplanets import model as habitability
+from exoplanets.snapshot import SNAPSHOT_DIR
+
+STORE_PATH = os.path.join(SNAPSHOT_DIR, 'predictions.parquet')
+SCORE_COLUMNS = ['prediction', 'probability', 'low', 'high']
+STORE_COLUMNS = ['feature_hash'] + SCORE_COLUMNS + ['model_version']
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def row_hashes(pipeline, planets):
+    """One uint64 per row, over the raw columns the feature pipeline reads."""
+    columns = [c for c in pipeline.columns if c in planets.columns]
+    return pd.util.hash_pandas_object(planets[columns], index=False).to_numpy()
+
+
+class PredictionStore:
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            # stores written before the probabilities were kept lack their columns
+            self.frame = pd.read_parquet(path).set_index('pl_name').reindex(columns=STORE_COLUMNS)
+        else:
+            self.frame = pd.DataFrame(columns=STORE_COLUMNS, index=pd.Index([], name='pl_name'))
+
+    def score(self, artifact, planets, interval=False):
+        """``prediction``, ``probability``, ``low`` and ``high`` for ``planets``, aligned on its index.
+
+        Only rows that are new, changed, or scored by another model are
+        predicted, in one batch; the store is updated (and saved) with them.
+        The bounds are only computed with ``interval``, NaN otherwise.
+        """
+        model_version = habitability.model_version(artifact, interval)
+        hashes = row_hashes(artifact['pipeline'], planets)
+        names = planets['pl_name'].to_numpy()
+
+        with self._lock:
+            known = self.frame.reindex(names)
+            fresh = ((known['model_version'] == model_version).to_numpy()
+                     & (known['feature_hash'].to_numpy() == hashes)
+                     & known['probability'].notna().to_numpy())
+            result = {column: known[column].to_numpy(dtype=float, na_value=np.nan, copy=True)
+                      for column in SCORE_COLUMNS}
+
+            stale = ~fresh
+            if stale.any():
+                scores = habitability.predict_proba(artifact, planets[stale], interval)
+                for column in SCORE_COLUMNS:
+                    result[column][stale] = scores[column].to_numpy(dtype=float)
+                update = pd.DataFrame({'feature_hash': hashes[stale],
+                                       **{column: result[column][stale] for column in SCORE_COLUMNS},
+                                       'model_version': model_version},
+                                      index=pd.Index(names[stale], name='pl_name'))
+                update = update[~update.index.duplicated(keep='last')]
+                kept = self.frame[~self.frame.index.isin(update.index)]
+                self.frame = pd.concat([kept, update]) if len(kept) else update
+                self.save()
+
+        result = pd.DataFrame(result, index=planets.index)
+        result['prediction'] = result['prediction'].astype(int)
+        return result
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.frame.reset_index().to_parquet(self.path + '.tmp', index=False)
+        os.replace(self.path + '.tmp', self.path)
+
+
+def get_store(path=STORE_PATH):
+    """Prediction store for ``path``, shared by every session of the process."""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = PredictionStore(path)
+        return store
@@ -0,0 +1,60 @@
+"""Habitability profiles: how habitable planets differ from the whole catalog.
+
+The PHL catalog is reduced at ingest to one count table keyed by star type,
+planet type, star age group and whether the planet is habitable (see
+``DERIVED_TABLES`` in ``exoplanets.derived``). Each profile shown on the
+habitable page, the share of planets per star type, per age group or per
+planet type among all planets and among habitable ones, is then a small
+aggregation of that table.
+
+Age groups are set by ``EXOPLANET_AGE_BINS`` (Gy, default ``2,4,6,8,10``):
+below the first edge, between consecutive edges, and above the last one.
+Ingest the PHL catalog again after changing them.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+AGE_BINS = tuple(float(edge) for edge in os.environ.get('EXOPLANET_AGE_BINS', '2,4,6,8,10').split(','))
+STAR_TYPES = ['O', 'B', 'A', 'F', 'G', 'K', 'M']
+PLANET_TYPES = ['Miniterran', 'Subterran', 'Terran', 'Superterran', 'Neptunian', 'Jovian']
+PROFILE_COLUMNS = ['S_TYPE_TEMP', 'P_TYPE', 'S_AGE', 'P_HABITABLE']
+
+
+def age_labels(edges=AGE_BINS):
+    """'<2', '2-4', ..., '+10' for the edges 2, 4, ..., 10."""
+    edges = ['%g' % edge for edge in edges]
+    return [f'<{edges[0]}'] + [f'{low}-{high}' for low, high in zip(edges, edges[1:])] + [f'+{edges[-1]}']
+
+
+def age_groups(ages, edges=AGE_BINS):
+    """Age group label of each star, NaN when its age is unknown."""
+    ages = pd.Series(ages)
+    codes = np.searchsorted(np.asarray(edges), ages.to_numpy(dtype=float, na_value=np.nan), side='right')
+    codes[ages.isna().to_numpy()] = -1
+    return pd.Series(pd.Categorical.from_codes(codes, age_labels(edges)), index=ages.index)
+
+
+def profile_keys(frame, edges=AGE_BINS):
+    return pd.DataFrame({'S_TYPE_TEMP': frame['S_TYPE_TEMP'],
+                         'P_TYPE': frame['P_TYPE'],
+                         'age_group': age_groups(frame['S_AGE'], edges).astype(object),
+                         'habitable': frame['P_HABITABLE'].isin([1, 2])})
+
+
+def profile(counts, key, order=None):
+    """Share (%) of all planets and of habitable ones per value of ``key``.
+
+    ``counts`` is the count table built from ``profile_keys``; planets with
+    no value for ``key`` are left out, and ``order`` fixes the rows shown.
+    """
+    known = counts[counts[key].notna()]
+    table = pd.DataFrame({
+        'Exoplanètes': known.groupby(key)['count'].sum(),
+        'Habitables': known[known['habitable']].groupby(key)['count'].sum(),
+    })
+    table = (table / table.sum() * 100).fillna(0)
+    if order is not None:
+        table = table.reindex(list(order) + [v for v in table.index if v not in order], fill_value=0)
+    return table.round(2)
@@ -0,0 +1,203 @@
+"""Per-rerun timing and memory profile of the WebApp pages.
+
+A rerun is opened with ``start(page)`` and closed with ``finish()``; in
+between, each stage of the page runs inside ``section(name)``, which records
+its wall time and, when memory tracing is on, the net and peak memory it
+allocated. Sections nest, and outside of a profiled rerun they cost nothing.
+
+Reruns are profiled when the debug panel is ticked in the sidebar or for
+every session when ``EXOPLANET_PROFILE=1``. Each profiled rerun is appended
+as one JSON line to ``PROFILE_LOG``, and the log can be summarized per page
+and section::
+
+    python -m exoplanets.profiling data/profile.jsonl
+
+tracemalloc is process-wide: while it runs it slows every allocation down
+and, with concurrent sessions, memory figures include the other sessions'
+allocations. It is started by the first profiled rerun and stopped when the
+last one still running in the process finishes, so sessions that are not
+profiled only pay for it while another one is. Set
+``EXOPLANET_PROFILE_MEMORY=0`` to only record timings.
+"""
+import argparse
+import datetime
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+ENABLED = os.environ.get('EXOPLANET_PROFILE') == '1'
+TRACE_MEMORY = os.environ.get('EXOPLANET_PROFILE_MEMORY', '1') == '1'
+PROFILE_LOG = os.environ.get('EXOPLANET_PROFILE_LOG', os.path.join('data', 'profile.jsonl'))
+
+_state = threading.local()
+_log_lock = threading.Lock()
+# profiled reruns tracing memory, and whether tracing was started for them
+_tracing = 0
+_started_tracing = False
+_tracing_lock = threading.Lock()
+
+
+class Section:
+    """Timing and memory (KB) of one stage of a rerun."""
+
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.seconds = None
+        self.memory = None
+        self.peak = None
+
+    def to_dict(self):
+        return {'name': self.name, 'depth': self.depth, 'seconds': self.seconds,
+                'memory_kb': self.memory, 'peak_kb': self.peak}
+
+
+class Rerun:
+    """Sections recorded while rendering ``page`` once."""
+
+    def __init__(self, page, trace_memory):
+        self.page = page
+        self.trace_memory = trace_memory
+        self.started = time.perf_counter()
+        self.timestamp = datetime.datetime.now().isoformat(timespec='seconds')
+        self.sections = []
+        self.seconds = None
+        # open sections: [start memory, highest memory seen]
+        self._stack = []
+
+    def to_dict(self):
+        return {'time': self.timestamp, 'page': self.page, 'seconds': self.seconds,
+                'sections': [s.to_dict() for s in self.sections]}
+
+    def to_frame(self):
+        """Sections as a frame, names indented by depth, for the debug panel."""
+        frame = pd.DataFrame([s.to_dict() for s in self.sections],
+                             columns=['name', 'depth', 'seconds', 'memory_kb', 'peak_kb'])
+        frame['name'] = [' ' * 4 * s.depth + s.name for s in self.sections]
+        return frame.drop(columns='depth').set_index('name')
+
+
+def current():
+    """The rerun being profiled in this thread, if any."""
+    return getattr(_state, 'rerun', None)
+
+
+def _acquire_tracing():
+    global _tracing, _started_tracing
+    with _tracing_lock:
+        if not _tracing and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing += 1
+
+
+def _release_tracing():
+    # tracing started by someone else (PYTHONTRACEMALLOC, a debugger) is left on
+    global _tracing, _started_tracing
+    with _tracing_lock:
+        _tracing -= 1
+        if not _tracing and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+def start(page, trace_memory=TRACE_MEMORY):
+    """Start profiling a rerun of ``page`` in this thread."""
+    if current() is not None:
+        # the previous rerun of this thread never finished
+        finish(log=None)
+    if trace_memory:
+        _acquire_tracing()
+    _state.rerun = Rerun(page, trace_memory)
+    return _state.rerun
+
+
+def finish(log=PROFILE_LOG):
+    """Close the rerun of this thread, append it to ``log`` and return it."""
+    rerun = current()
+    if rerun is None:
+        return None
+    _state.rerun = None
+    if rerun.trace_memory:
+        _release_tracing()
+    rerun.seconds = round(time.perf_counter() - rerun.started, 4)
+    if log:
+        os.makedirs(os.path.dirname(log) or '.', exist_ok=True)
+        line = json.dumps(rerun.to_dict(), ensure_ascii=False)
+        with _log_lock, open(log, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+    return rerun
+
+
+def _memory(rerun):
+    # current and peak traced memory, the peak being credited to the enclosing
+    # section before it is reset (reset_peak is only available from Python 3.9)
+    current_memory, peak = tracemalloc.get_traced_memory()
+    if rerun._stack:
+        rerun._stack[-1][1] = max(rerun._stack[-1][1], peak)
+    return current_memory, peak
+
+
+@contextmanager
+def section(name):
+    """Record the time and memory spent in the block as section ``name``."""
+    rerun = current()
+    if rerun is None:
+        yield None
+        return
+
+    record = Section(name, len(rerun._stack))
+    rerun.sections.append(record)
+    trace = rerun.trace_memory and tracemalloc.is_tracing()
+    if trace:
+        before, _ = _memory(rerun)
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        rerun._stack.append([before, before])
+    started = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record.seconds = round(time.perf_counter() - started, 4)
+        if trace:
+            after, _ = _memory(rerun)
+            before, highest = rerun._stack.pop()
+            record.memory = round((after - before) / 1024, 1)
+            if hasattr(tracemalloc, 'reset_peak'):
+                record.peak = round((highest - before) / 1024, 1)
+            if rerun._stack:
+                rerun._stack[-1][1] = max(rerun._stack[-1][1], highest)
+
+
+def summarize(log=PROFILE_LOG):
+    """Median, 95th percentile and max time of each section of each page in ``log``."""
+    with open(log, encoding='utf-8') as f:
+        reruns = [json.loads(line) for line in f if line.strip()]
+    sections = pd.json_normalize(reruns, 'sections', ['page'])
+    totals = pd.DataFrame({'page': [r['page'] for r in reruns], 'name': '(rerun)',
+                           'seconds': [r['seconds'] for r in reruns]})
+    sections = pd.concat([totals, sections], ignore_index=True)
+    grouped = sections.groupby(['page', 'name'], sort=False)
+    summary = grouped['seconds'].describe(percentiles=[0.5, 0.95])
+    summary = summary[['count', '50%', '95%', 'max']].rename(columns={'50%': 'median', '95%': 'p95'})
+    if 'peak_kb' in sections:
+        summary['peak_kb'] = grouped['peak_kb'].max()
+    return summary.sort_values(['page', 'p95'], ascending=[True, False])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize the profile log of the WebApp.")
+    parser.add_argument('log', nargs='?', default=PROFILE_LOG)
+    args = parser.parse_args(argv)
+
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        print(summarize(args.log).round(4))
+
+
+if __name__ == '__main__':
+    main()
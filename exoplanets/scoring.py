@@ -0,0 +1,139 @@
+"""Batch habitability scoring of a catalog file, without the WebApp.
+
+The input, CSV or Parquet, is read in chunks of ``CHUNKSIZE`` rows and only
+for the columns the model reads. Chunks are scored in a process pool, each
+worker loading the saved model once, and written in input order to a
+Parquet file of ``pl_name``, ``prediction``, ``probability`` (that the
+planet is habitable) and, with ``--interval``, its bootstrap interval
+``low``-``high`` (one more pass per bootstrap copy, null otherwise)::
+
+    python -m exoplanets.scoring candidates.csv --output data/scores.parquet --interval
+
+The latest saved model is used unless ``--model-version`` names another one
+(see ``python -m exoplanets.model``). At most two chunks per worker are in
+flight, so memory stays bounded whatever the size of the input.
+"""
+import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from exoplanets import model as habitability
+from exoplanets.features import TARGET
+
+CHUNKSIZE = 100000
+OUTPUT_SCHEMA = pa.schema([('pl_name', pa.string()), ('prediction', pa.int8()), ('probability', pa.float32()),
+                           ('low', pa.float32()), ('high', pa.float32())])
+
+# model of the worker process and whether to compute the bounds, set by _init_worker
+_artifact = None
+_interval = False
+
+
+def _init_worker(dataset_version, model_dir, interval):
+    global _artifact, _interval
+    _artifact, _interval = habitability.load(dataset_version, model_dir), interval
+    # one booster thread per worker, the pool already uses every core
+    for booster in [_artifact['model']] + _artifact['ensemble']:
+        booster.set_params(n_jobs=1)
+
+
+def score_chunk(artifact, planets, interval=False):
+    """``pl_name``, ``prediction``, ``probability``, ``low`` and ``high`` for each row of ``planets``."""
+    scores = habitability.predict_proba(artifact, planets, interval)
+    # missing names stay null rather than becoming 'nan'
+    names = planets['pl_name'].to_numpy(dtype=object)
+    names = np.where(pd.isna(names), None, names.astype(str))
+    return pd.DataFrame({'pl_name': names,
+                         'prediction': scores['prediction'].to_numpy().astype('int8'),
+                         **{column: scores[column].to_numpy().astype('float32')
+                            for column in ('probability', 'low', 'high')}})
+
+
+def _score(planets):
+    return score_chunk(_artifact, planets, _interval)
+
+
+def read_chunks(path, columns, chunksize=CHUNKSIZE):
+    """Frames of at most ``chunksize`` rows of ``path``, restricted to ``columns``."""
+    if path.endswith('.parquet'):
+        parquet = pq.ParquetFile(path)
+        present = [c for c in columns if c in parquet.schema_arrow.names]
+        for batch in parquet.iter_batches(chunksize, columns=present):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=lambda c: c in columns, chunksize=chunksize)
+
+
+def score_file(source, output, dataset_version, model_dir=None, chunksize=CHUNKSIZE,
+               workers=None, unrated_only=False, interval=False):
+    """Score every planet of ``source`` (or those not rated by the PHL) into ``output``.
+
+    Returns the number of planets scored.
+    """
+    artifact = habitability.load(dataset_version, model_dir)
+    if artifact is None:
+        raise FileNotFoundError(habitability.artifact_path(dataset_version, model_dir))
+    columns = set(artifact['pipeline'].columns) | {'pl_name', TARGET}
+
+    def chunks():
+        for planets in read_chunks(source, columns, chunksize):
+            if unrated_only and TARGET in planets:
+                planets = planets[planets[TARGET].isna()]
+            if len(planets):
+                yield planets
+
+    workers = workers or os.cpu_count()
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    rows = 0
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(dataset_version, model_dir, interval)) as pool, \
+            pq.ParquetWriter(output + '.tmp', OUTPUT_SCHEMA) as writer:
+        pending = deque()
+
+        def write_oldest():
+            scores = pending.popleft().result()
+            writer.write_table(pa.Table.from_pandas(scores, OUTPUT_SCHEMA, preserve_index=False))
+            return len(scores)
+
+        for planets in chunks():
+            pending.append(pool.submit(_score, planets))
+            if len(pending) >= 2 * workers:
+                rows += write_oldest()
+        while pending:
+            rows += write_oldest()
+    os.replace(output + '.tmp', output)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score the habitability of a catalog with the saved model.")
+    parser.add_argument('source', help="CSV or Parquet catalog, NEA columns")
+    parser.add_argument('--output', default=os.path.join('data', 'scores.parquet'))
+    parser.add_argument('--model-dir', default=habitability.MODEL_DIR)
+    parser.add_argument('--model-version', help="dataset version of the model, the latest by default")
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--workers', type=int, default=None, help="processes, all cores by default")
+    parser.add_argument('--unrated', action='store_true', help="only score planets not rated by the PHL")
+    parser.add_argument('--interval', action='store_true', help="also compute the bootstrap interval")
+    args = parser.parse_args(argv)
+
+    version = args.model_version
+    if version is None:
+        versions = habitability.list_versions(args.model_dir)
+        if not versions:
+            parser.error(f'no model in {args.model_dir}, train one with `python -m exoplanets.model`')
+        version = versions[-1]
+
+    rows = score_file(args.source, args.output, version, args.model_dir, args.chunksize,
+                      args.workers, args.unrated, args.interval)
+    print(f'{rows} planets scored with model {version} into {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+"""Local HTTP service predicting the habitability of planet records.
+
+Built on the standard library only, it serves the saved model::
+
+    python -m exoplanets.service --port 8765
+
+    POST /predict   a JSON record of NEA columns, or a list of them
+                    -> {"model_version": ..., "predictions": [{"pl_name", "prediction", "probability",
+                                                               "low", "high"}]}
+    GET  /metrics   request count, p50/p99 latency and batch sizes
+    GET  /health
+
+Requests are handled in threads but do not call the booster themselves:
+they are queued, and a single batching thread takes up to ``MAX_BATCH``
+rows, waiting at most ``MAX_WAIT`` seconds after the first one, and scores
+them together in one ``model.predict_proba`` call. Under concurrent load
+one pass of the model serves many requests; a lone request only waits
+``MAX_WAIT``. ``low`` and ``high`` are null unless the server is started
+with ``--interval``, which costs one more pass per bootstrap copy.
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from exoplanets import astro
+from exoplanets import model as habitability
+
+MAX_BATCH = 512
+# seconds
+MAX_WAIT = 0.005
+# latencies kept for the percentiles
+WINDOW = 10000
+# pending connections before new ones are refused, the default of 5 is too few for bursts
+REQUEST_QUEUE_SIZE = 128
+
+
+def records_frame(records, pipeline):
+    """Frame of the JSON ``records``, numeric features and astrophysical inputs checked as numbers."""
+    if isinstance(records, dict):
+        records = [records]
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        raise ValueError('expected a JSON object or a list of objects')
+    for record in records:
+        for column, value in record.items():
+            if isinstance(value, (list, dict)):
+                raise ValueError(f'{column}: expected a single value, not {type(value).__name__}')
+    frame = pd.DataFrame.from_records(records)
+    # the derived features read the astrophysical columns even when the model does not
+    for column in dict.fromkeys(pipeline.numeric_columns_ + astro.INPUT_COLUMNS):
+        if column in frame:
+            frame[column] = pd.to_numeric(frame[column])
+    if 'pl_name' not in frame:
+        frame['pl_name'] = None
+    return frame
+
+
+class LatencyStats:
+    """Request latencies and batch sizes over the last ``window`` requests."""
+
+    def __init__(self, window=WINDOW):
+        self.requests = 0
+        self.batches = 0
+        self.batch_rows = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record_request(self, seconds):
+        with self._lock:
+            self.requests += 1
+            self._latencies.append(seconds)
+
+    def record_batch(self, rows):
+        with self._lock:
+            self.batches += 1
+            self.batch_rows += rows
+
+    def to_dict(self):
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            summary = {'requests': self.requests, 'batches': self.batches,
+                       'mean_batch_rows': self.batch_rows / self.batches if self.batches else None}
+        p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (None, None)
+        summary.update(p50_ms=p50, p99_ms=p99)
+        return summary
+
+
+class MicroBatcher:
+    """Scores queued frames together, in a background thread."""
+
+    def __init__(self, artifact, max_batch=MAX_BATCH, max_wait=MAX_WAIT, stats=None, interval=False):
+        self.artifact = artifact
+        self.interval = interval
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.stats = stats or LatencyStats()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, frame):
+        """Future of the predictions for ``frame``."""
+        future = Future()
+        self._queue.put((frame, future))
+        return future
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        rows = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+
+    def _score(self, frames):
+        planets = pd.concat(frames, ignore_index=True)
+        scores = habitability.predict_proba(self.artifact, planets, self.interval)
+        self.stats.record_batch(len(planets))
+        # NaN bounds (no interval asked, or a model without ensemble) are sent as null
+        scores['prediction'] = scores['prediction'].astype(int)
+        return scores.astype(object).where(scores.notna(), None).to_dict('records')
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                rows = self._score([frame for frame, _ in batch])
+            except Exception:
+                # a record the checks let through fails its own request, not the whole batch
+                for frame, future in batch:
+                    try:
+                        future.set_result(self._predictions(frame, self._score([frame])))
+                    except Exception as error:
+                        future.set_exception(error)
+                continue
+            start = 0
+            for frame, future in batch:
+                end = start + len(frame)
+                future.set_result(self._predictions(frame, rows[start:end]))
+                start = end
+
+    @staticmethod
+    def _predictions(frame, rows):
+        return [{'pl_name': name, **row} for name, row in zip(frame['pl_name'], rows)]
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    # set on the subclass built by make_server
+    batcher = None
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == '/metrics':
+            self._send(200, self.batcher.stats.to_dict())
+        elif self.path == '/health':
+            self._send(200, {'status': 'ok', 'model_version': self.batcher.artifact['dataset_version']})
+        else:
+            self._send(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path != '/predict':
+            self._send(404, {'error': 'not found'})
+            return
+        started = time.perf_counter()
+        try:
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            frame = records_frame(json.loads(body), self.batcher.artifact['pipeline'])
+        except (TypeError, ValueError) as error:
+            self._send(400, {'error': str(error)})
+            return
+        try:
+            predictions = self.batcher.submit(frame).result() if len(frame) else []
+        except Exception as error:
+            self._send(500, {'error': str(error)})
+            return
+        self.batcher.stats.record_request(time.perf_counter() - started)
+        self._send(200, {'model_version': self.batcher.artifact['dataset_version'], 'predictions': predictions})
+
+    def log_message(self, format, *args):
+        # one line per request would dominate the cost of small requests
+        pass
+
+
+class PredictionServer(ThreadingHTTPServer):
+    request_queue_size = REQUEST_QUEUE_SIZE
+
+
+def make_server(artifact, host='127.0.0.1', port=8765, max_batch=MAX_BATCH, max_wait=MAX_WAIT, interval=False):
+    """HTTP server predicting with ``artifact``, not started yet."""
+    batcher = MicroBatcher(artifact, max_batch, max_wait, interval=interval)
+    handler = type('Handler', (PredictionHandler,), {'batcher': batcher})
+    return PredictionServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve habitability predictions over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--model-dir', default=habitability.MODEL_DIR)
+    parser.add_argument('--model-version', help="dataset version of the model, the latest by default")
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    parser.add_argument('--max-wait', type=float, default=MAX_WAIT, help="seconds")
+    parser.add_argument('--interval', action='store_true', help="also compute the bootstrap interval")
+    args = parser.parse_args(argv)
+
+    version = args.model_version
+    if version is None:
+        versions = habitability.list_versions(args.model_dir)
+        if not versions:
+            parser.error(f'no model in {args.model_dir}, train one with `python -m exoplanets.model`')
+        version = versions[-1]
+    artifact = habitability.load(version, args.model_dir)
+    if artifact is None:
+        parser.error(f'no model {version} in {args.model_dir}')
+
+    server = make_server(artifact, args.host, args.port, args.max_batch, args.max_wait, args.interval)
+    print(f'serving model {version} on http://{args.host}:{server.server_port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
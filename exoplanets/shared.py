@@ -0,0 +1,136 @@
+"""Numeric snapshot columns shared by every worker process.
+
+When a snapshot is written, its plain numeric columns are also saved under
+``<snapshot dir>/shared/<name>-<version>/``, one ``.npy`` file per dtype
+holding all the columns of that dtype, one per row of the array. Workers map
+these files read-only instead of parsing their own copy, so the columns live
+once in the page cache whatever the number of Streamlit processes. Text and
+categorical columns are still read by each process, from a Parquet file of
+the same directory: a directory holds a whole version of the snapshot, and
+appears complete or not at all.
+
+Each dtype's columns become a single block of the frames built here, so
+pandas has nothing to consolidate and never copies them into a private
+block. Frames reference the whole mapped array when all the shared columns
+of a dtype are requested, or a contiguous run of them; other selections copy
+the requested columns of that dtype. Shared columns come first in the
+frames, grouped by dtype, then the other columns. Any attempt to modify them
+in place fails with ``ValueError: assignment destination is read-only``:
+``.copy()`` first.
+"""
+import glob
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+# bumped whenever the layout of the shared files changes
+LAYOUT = 2
+# the columns that are not memory mapped
+OTHERS = 'others.parquet'
+
+_maps = {}
+_frames = {}
+_lock = threading.Lock()
+
+
+def shared_dir(name, version, snapshot_dir):
+    return os.path.join(snapshot_dir, 'shared', f'{name}-{version}-v{LAYOUT}')
+
+
+def publish(name, frame, version, snapshot_dir):
+    """Save version ``version`` of snapshot ``name``, numeric columns for memory mapping."""
+    target = shared_dir(name, version, snapshot_dir)
+    if not os.path.exists(target):
+        tmp = target + '.tmp'
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        blocks = {}
+        for column in frame.columns:
+            dtype = frame[column].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+                blocks.setdefault(dtype.name, []).append(column)
+        for dtype, columns in blocks.items():
+            np.save(os.path.join(tmp, f'{dtype}.npy'), np.stack([frame[c].to_numpy() for c in columns]))
+        shared = {c for columns in blocks.values() for c in columns}
+        frame[[c for c in frame.columns if c not in shared]].to_parquet(os.path.join(tmp, OTHERS), index=False)
+        with open(os.path.join(tmp, 'columns.json'), 'w') as f:
+            json.dump(blocks, f)
+        os.replace(tmp, target)
+
+
+def prune(name, version, snapshot_dir):
+    """Remove the shared files of the versions of ``name`` other than ``version``.
+
+    Processes still mapping them keep their pages until they let go.
+    """
+    target = shared_dir(name, version, snapshot_dir)
+    for old in glob.glob(os.path.join(snapshot_dir, 'shared', f'{name}-*')):
+        if old != target and not old.endswith('.tmp'):
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def open_blocks(name, version, snapshot_dir):
+    """Read-only memory maps of the shared columns of ``name``: dtype -> (columns, 2D array)."""
+    key = (snapshot_dir, name, version)
+    maps = _maps.get(key)
+    if maps is None:
+        directory = shared_dir(name, version, snapshot_dir)
+        try:
+            with open(os.path.join(directory, 'columns.json')) as f:
+                blocks = json.load(f)
+        except FileNotFoundError:
+            return {}
+        maps = {dtype: (columns, np.load(os.path.join(directory, f'{dtype}.npy'), mmap_mode='r'))
+                for dtype, columns in blocks.items()}
+        with _lock:
+            for old in [k for k in _maps if k[:2] == key[:2]]:
+                del _maps[old]
+            _maps[key] = maps
+    return maps
+
+
+def _block_frame(columns, values, wanted):
+    rows = [i for i, column in enumerate(columns) if column in wanted]
+    if rows == list(range(rows[0], rows[-1] + 1)):
+        # a slice of the map is still a view of it
+        values = values[rows[0]:rows[-1] + 1]
+    else:
+        values = values[rows]
+    return pd.DataFrame(values.T, columns=[columns[i] for i in rows], copy=False)
+
+
+def load_frame(name, version, snapshot_dir, columns):
+    """``columns`` of version ``version`` of snapshot ``name``, from its shared files.
+
+    Frames are built once per column set and version, and ``None`` is
+    returned when that version was not published.
+    """
+    blocks = open_blocks(name, version, snapshot_dir)
+    if not blocks:
+        return None
+    key = (snapshot_dir, name, version, tuple(columns))
+    frame = _frames.get(key)
+    if frame is None:
+        wanted = set(columns)
+        parts = [_block_frame(shared_columns, values, wanted)
+                 for shared_columns, values in blocks.values() if wanted.intersection(shared_columns)]
+        shared = {column for part in parts for column in part.columns}
+        others = [c for c in columns if c not in shared]
+        if others:
+            try:
+                parts.append(pd.read_parquet(os.path.join(shared_dir(name, version, snapshot_dir), OTHERS),
+                                             columns=others))
+            except FileNotFoundError:
+                # pruned by a newer version since the maps were opened
+                return None
+        # blocks of distinct dtypes side by side: pandas keeps them as they are
+        frame = pd.concat(parts, axis=1, copy=False) if len(parts) > 1 else parts[0]
+        with _lock:
+            for old in [k for k in _frames if k[:2] == key[:2] and k[2] != version]:
+                del _frames[old]
+            frame = _frames.setdefault(key, frame)
+    return frame
@@ -0,0 +1,142 @@
+"""Known habitable planets most similar to a given planet.
+
+Planets are compared on the numeric features of the habitability model
+(``FeaturePipeline.numeric_columns_``, missing values imputed the same way),
+each standardized over the whole catalog so that no unit dominates the
+distance. The habitable planets (``P_HABITABLE`` 1 or 2) are indexed in a
+ball tree, built once per snapshot and model version, and a top-k query is a
+tree search instead of a scan of the catalog::
+
+    python -m exoplanets.similarity "Kepler-22 b" "TRAPPIST-1 e" --k 5
+
+``SimilarityIndex.query`` answers a whole frame of planets at once, for batch
+use.
+"""
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import BallTree
+
+from exoplanets import model as habitability
+from exoplanets.features import TARGET
+from exoplanets.snapshot import load_snapshot, snapshot_version
+
+K = 5
+HABITABLE = (1, 2)
+LEAF_SIZE = 40
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+class SimilarityIndex:
+
+    def __init__(self, planets, pipeline, leaf_size=LEAF_SIZE):
+        self.pipeline = pipeline
+        features = self._features(planets)
+        self.center_ = features.mean(axis=0)
+        scale = features.std(axis=0)
+        # constant features carry no information, keep them from dividing by 0
+        self.scale_ = np.where(scale > 0, scale, 1)
+
+        habitable = planets[TARGET].isin(HABITABLE).to_numpy()
+        self.names = planets['pl_name'].to_numpy(dtype=object)[habitable]
+        self.habitability = planets[TARGET].to_numpy()[habitable]
+        self.tree = BallTree(self.standardize(planets)[habitable], leaf_size=leaf_size)
+        # name -> planet row, for the queries by name
+        self.planets = planets
+        self._names = pd.Index(planets['pl_name'])
+
+    def _features(self, planets):
+        return self.pipeline.transform(planets)[self.pipeline.numeric_columns_].to_numpy()
+
+    def standardize(self, planets):
+        return (self._features(planets) - self.center_) / self.scale_
+
+    def query(self, planets, k=K):
+        """The ``k`` habitable planets closest to each row of ``planets``.
+
+        One row per (planet, neighbour), nearest first; a habitable planet is
+        never returned as its own neighbour, so it gets one fewer when ``k``
+        covers the whole index.
+        """
+        k = min(k, len(self.names))
+        names = (planets['pl_name'] if 'pl_name' in planets else planets.index).to_numpy(dtype=object)
+        if not len(planets) or not k:
+            return pd.DataFrame({'pl_name': [], 'rank': [], 'similar': [], 'P_HABITABLE': [], 'distance': []})
+        distances, neighbours = self.tree.query(self.standardize(planets), k=min(k + 1, len(self.names)))
+        # drop each planet's own match, then keep the k nearest of the others
+        others = self.names[neighbours] != names[:, None]
+        keep = others & (np.cumsum(others, axis=1) <= k)
+        rows = np.nonzero(keep)[0]
+        return pd.DataFrame({'pl_name': names[rows],
+                             'rank': np.cumsum(keep, axis=1)[keep],
+                             'similar': self.names[neighbours[keep]],
+                             'P_HABITABLE': self.habitability[neighbours[keep]],
+                             'distance': distances[keep]})
+
+    def similar(self, names, k=K):
+        """``query`` for planets of the catalog given by name; unknown names raise ``KeyError``."""
+        names = [names] if isinstance(names, str) else list(names)
+        rows = self._names.get_indexer(names)
+        if (rows < 0).any():
+            raise KeyError(', '.join(n for n, r in zip(names, rows) if r < 0))
+        return self.query(self.planets.iloc[rows], k)
+
+
+def get_index(planets, artifact, snapshot=None):
+    """Index of ``planets`` for the features of ``artifact``, built once per process.
+
+    ``snapshot`` is the catalog snapshot version; without it the index is
+    kept for as long as the same frame is passed.
+    """
+    key = (snapshot if snapshot is not None else id(planets), artifact['dataset_version'])
+    cached = _indexes.get(key)
+    if cached is not None and (snapshot is not None or cached.planets is planets):
+        return cached
+    with _lock:
+        cached = _indexes.get(key)
+        if cached is None or (snapshot is None and cached.planets is not planets):
+            cached = SimilarityIndex(planets, artifact['pipeline'])
+            _indexes.clear()
+            _indexes[key] = cached
+    return cached
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the known habitable planets most similar to others.")
+    parser.add_argument('names', nargs='*', help="planet names of the NEA catalog")
+    parser.add_argument('--input', help="CSV or Parquet file of planets (NEA columns) to query instead")
+    parser.add_argument('--output', help="CSV file for the results, printed otherwise")
+    parser.add_argument('--k', type=int, default=K)
+    parser.add_argument('--nea', default='planets.csv',
+                        help="NEA catalog CSV, used when no 'nea' snapshot was ingested")
+    parser.add_argument('--model-dir', default=habitability.MODEL_DIR)
+    args = parser.parse_args(argv)
+    if not args.names and not args.input:
+        parser.error('give planet names or --input')
+
+    planets = load_snapshot('nea', args.nea)
+    snapshot = snapshot_version('nea')
+    index = get_index(planets, habitability.load_or_train(planets, snapshot, args.model_dir), snapshot)
+    if args.input:
+        queries = (pd.read_parquet(args.input) if args.input.endswith('.parquet')
+                   else pd.read_csv(args.input))
+        results = index.query(queries, args.k)
+    else:
+        try:
+            results = index.similar(args.names, args.k)
+        except KeyError as error:
+            parser.error(f'unknown planets: {error.args[0]}')
+
+    if args.output:
+        results.to_csv(args.output, index=False)
+    else:
+        with pd.option_context('display.width', 200, 'display.max_rows', None):
+            print(results.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""Typed columnar snapshots of the NEA and PHL catalogs.
+
+``ingest`` converts a catalog CSV into a Parquet file where the low
+cardinality text columns are stored as categoricals, plus a small JSON
+sidecar holding the dataset version. Pages then ask ``load_snapshot`` for the
+columns they actually use, so a worker only materializes those columns::
+
+    python -m exoplanets.snapshot nea=planets.csv phl=http://.../phl_exoplanet_catalog.csv
+
+When no snapshot has been ingested yet, ``load_snapshot`` falls back to the
+CSV, still restricted to the requested columns.
+
+The numeric columns of each snapshot are also published as memory-mapped
+arrays shared by every worker process (see ``exoplanets.shared``).
+"""
+import argparse
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from exoplanets import shared
+from exoplanets.loader import load_catalog
+
+SNAPSHOT_DIR = os.environ.get('EXOPLANET_DATA_DIR', 'data')
+CATEGORICAL_COLUMNS = ('discoverymethod', 'disc_locale', 'S_TYPE_TEMP', 'P_TYPE')
+
+
+def snapshot_path(name, snapshot_dir=None):
+    return os.path.join(snapshot_dir or SNAPSHOT_DIR, f'{name}.parquet')
+
+
+def _meta_path(name, snapshot_dir=None):
+    return os.path.join(snapshot_dir or SNAPSHOT_DIR, f'{name}.json')
+
+
+def dataset_hash(frame):
+    """Content hash of a frame, independent of its index and of categorical encoding."""
+    digest = hashlib.sha1(','.join(map(str, frame.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def to_snapshot_dtypes(frame):
+    """Cast the known categorical columns present in ``frame``, in place."""
+    for column in CATEGORICAL_COLUMNS:
+        if column in frame.columns:
+            frame[column] = frame[column].astype('category')
+    return frame
+
+
+def write_snapshot(name, frame, source, snapshot_dir=None):
+    """Write ``frame`` as snapshot ``name`` and return its version."""
+    snapshot_dir = snapshot_dir or SNAPSHOT_DIR
+    os.makedirs(snapshot_dir, exist_ok=True)
+    version = dataset_hash(frame)
+
+    # the shared files hold a whole version: published first, a worker that
+    # reads the new sidecar finds them complete, one that read the old one
+    # still reads the old version's
+    shared.publish(name, frame, version, snapshot_dir)
+
+    # write then rename, so workers never read a half-written file
+    path = snapshot_path(name, snapshot_dir)
+    meta_path = _meta_path(name, snapshot_dir)
+    frame.to_parquet(path + '.tmp', index=False)
+    meta = {'name': name, 'source': str(source), 'version': version,
+            'rows': len(frame), 'columns': list(frame.columns)}
+    with open(meta_path + '.tmp', 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(path + '.tmp', path)
+    os.replace(meta_path + '.tmp', meta_path)
+    shared.prune(name, version, snapshot_dir)
+    return version
+
+
+def ingest(name, source, snapshot_dir=None):
+    """Convert the catalog at ``source`` into snapshot ``name`` and return its version.
+
+    The tables derived from the snapshot are rebuilt as well.
+    """
+    # imported here because the derived tables module depends on this one
+    from exoplanets.derived import build_all
+
+    frame = to_snapshot_dtypes(pd.read_csv(source))
+    version = write_snapshot(name, frame, source, snapshot_dir)
+    build_all(name, frame, snapshot_dir)
+    return version
+
+
+def snapshot_info(name, snapshot_dir=None):
+    """Sidecar metadata of snapshot ``name``, or ``None`` if it was never ingested."""
+    try:
+        with open(_meta_path(name, snapshot_dir)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def snapshot_version(name, snapshot_dir=None):
+    info = snapshot_info(name, snapshot_dir)
+    return info['version'] if info else None
+
+
+def load_snapshot(name, source, columns=None, snapshot_dir=None):
+    """Return the ``columns`` of snapshot ``name`` (all of them if ``None``).
+
+    Frames come from the shared files of the current version, numeric columns
+    mapped read-only, and are built once per process and column set (see
+    ``exoplanets.shared``). Without them the Parquet file is read, cached by
+    ``load_catalog``. ``source`` is only read when the snapshot does not exist.
+    """
+    path = snapshot_path(name, snapshot_dir)
+    if os.path.exists(path):
+        info = snapshot_info(name, snapshot_dir)
+        if info is not None:
+            frame = shared.load_frame(name, info['version'], snapshot_dir or SNAPSHOT_DIR,
+                                      info['columns'] if columns is None else list(columns))
+            if frame is not None:
+                return frame
+        if columns is None:
+            return load_catalog(path)
+        return load_catalog(path, columns=list(columns))
+    if columns is None:
+        return load_catalog(source)
+    return load_catalog(source, usecols=list(columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest catalogs as columnar snapshots.")
+    parser.add_argument('catalogs', nargs='+', metavar='NAME=SOURCE',
+                        help="snapshot name and CSV path or URL, e.g. nea=planets.csv")
+    parser.add_argument('--snapshot-dir', default=SNAPSHOT_DIR)
+    args = parser.parse_args(argv)
+
+    for catalog in args.catalogs:
+        name, source = catalog.split('=', 1)
+        version = ingest(name, source, args.snapshot_dir)
+        print(f'{name}: {snapshot_path(name, args.snapshot_dir)} (version {version})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+"""Synthetic NEA- and PHL-shaped catalogs for load testing.
+
+Column distributions follow the real archives closely enough for the pages
+and the model to behave as they do in production: discoveries peak with
+Kepler, transits dominate, radial velocity planets are closer and on longer
+orbits, habitable planets are rare and mostly rocky planets around K and M
+stars, and the PHL has not rated the most recent discoveries.
+
+Catalogs are generated and written chunk by chunk, so millions of rows
+never need to fit in memory at once::
+
+    python -m exoplanets.synthetic 2000000 --nea data/synthetic/planets.csv --phl data/synthetic/phl.csv
+
+Each chunk has its own random stream derived from the seed, so a given seed
+and chunk size always produce the same files.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+CHUNKSIZE = 100000
+
+YEARS = np.arange(1989, 2022)
+# relative number of discoveries per year, Kepler releases in 2014 and 2016
+YEAR_WEIGHTS = np.array([1, 0, 0, 2, 0, 1, 1, 1, 6, 6, 13, 16, 12, 30, 25, 25, 34, 28, 53, 65, 96,
+                         97, 139, 139, 125, 873, 154, 1503, 153, 317, 198, 236, 204], dtype=float)
+
+METHODS = ['Transit', 'Radial Velocity', 'Microlensing', 'Imaging', 'Transit Timing Variations',
+           'Eclipse Timing Variations', 'Orbital Brightness Modulation', 'Pulsar Timing', 'Astrometry']
+METHOD_WEIGHTS = np.array([0.757, 0.191, 0.025, 0.012, 0.005, 0.004, 0.002, 0.002, 0.002])
+
+STAR_TYPES = list('OBAFGKM')
+STAR_TYPE_WEIGHTS = np.array([0.001, 0.004, 0.02, 0.17, 0.45, 0.25, 0.105])
+STAR_TEFF = {'O': (33000, 5000), 'B': (15000, 4000), 'A': (8500, 700), 'F': (6500, 300),
+             'G': (5600, 200), 'K': (4500, 350), 'M': (3300, 300)}
+STAR_MASS = {'O': 20.0, 'B': 5.0, 'A': 2.0, 'F': 1.3, 'G': 1.0, 'K': 0.75, 'M': 0.4}
+
+PLANET_TYPES = ['Miniterran', 'Subterran', 'Terran', 'Superterran', 'Neptunian', 'Jovian']
+PLANET_TYPE_WEIGHTS = np.array([0.005, 0.015, 0.08, 0.25, 0.35, 0.30])
+# earth masses: upper bound of each planet type
+PLANET_TYPE_MASS = np.array([0.1, 0.5, 2, 10, 50, 4000])
+
+CONSTELLATIONS = ['Lyra', 'Cygnus', 'Aquarius', 'Virgo', 'Pegasus', 'Scorpius', 'Orion', 'Draco',
+                  'Hercules', 'Sagittarius', 'Cetus', 'Leo']
+GROUND_TELESCOPES = ['10 m Keck I Telescope', '3.6 m ESO Telescope', '1.93 m Telescope',
+                     '8.2 m Subaru Telescope', '1.3 m Warsaw University Telescope']
+CAMERA_LENSES = ['Canon 200mm f/1.8L', 'Canon 400mm f/2.8L', 'Mamiya 645 80mm f/1.9']
+
+
+def _choice(rng, values, weights, size):
+    return np.asarray(values, dtype=object)[rng.choice(len(values), size, p=weights / weights.sum())]
+
+
+def generate_chunk(rng, size, first_host=0):
+    """``(nea, phl, next_host)`` for ``size`` planets whose hosts are numbered from ``first_host``."""
+    # hosts with 1 to 6 planets, named b, c, d... in order
+    multiplicity = np.minimum(rng.geometric(0.6, size), 6)
+    hosts = first_host + np.repeat(np.arange(size), multiplicity)[:size]
+    rank = np.arange(size) - np.searchsorted(hosts, hosts)
+    letters = np.array(list('bcdefgh'), dtype=object)[rank]
+    hostnames = pd.Series(hosts).map('SYN-{}'.format).to_numpy(dtype=object)
+    names = hostnames + ' ' + letters
+
+    year = rng.choice(YEARS, size, p=YEAR_WEIGHTS / YEAR_WEIGHTS.sum())
+    method = _choice(rng, METHODS, METHOD_WEIGHTS, size)
+    transit = method == 'Transit'
+    rv = method == 'Radial Velocity'
+
+    telescope = _choice(rng, GROUND_TELESCOPES, np.ones(len(GROUND_TELESCOPES)), size)
+    kepler = transit & (year >= 2009) & (year <= 2018) & (rng.random(size) < 0.85)
+    tess = transit & (year >= 2018) & ~kepler & (rng.random(size) < 0.8)
+    lens = transit & ~kepler & ~tess & (rng.random(size) < 0.05)
+    telescope[kepler] = '0.95 m Kepler Telescope'
+    telescope[tess] = '0.1 m TESS Telescope'
+    telescope[lens] = _choice(rng, CAMERA_LENSES, np.ones(len(CAMERA_LENSES)), lens.sum())
+    locale = np.where(kepler | tess, 'Space', 'Ground').astype(object)
+
+    star_type = _choice(rng, STAR_TYPES, STAR_TYPE_WEIGHTS, size)
+    teff_mean, teff_sd = (np.array([STAR_TEFF[t][i] for t in star_type]) for i in (0, 1))
+    teff = rng.normal(teff_mean, teff_sd)
+    star_mass = np.array([STAR_MASS[t] for t in star_type]) * rng.lognormal(0, 0.1, size)
+    star_radius = star_mass ** 0.8
+    luminosity = star_radius ** 2 * (teff / 5772) ** 4
+
+    # parsecs: transit surveys look deeper than radial velocity ones
+    distance = rng.lognormal(np.where(rv, 3.7, np.where(transit, 6.0, 5.0)), 1.0)
+    period = rng.lognormal(np.where(rv, 5.5, np.where(transit, 2.3, 6.5)), np.where(rv, 1.5, 1.2))
+    semi_major_axis = (period / 365.25) ** (2 / 3) * star_mass ** (1 / 3)
+
+    planet_type = _choice(rng, PLANET_TYPES, PLANET_TYPE_WEIGHTS, size)
+    type_index = pd.Index(PLANET_TYPES).get_indexer(planet_type)
+    upper = PLANET_TYPE_MASS[type_index]
+    lower = np.where(type_index > 0, PLANET_TYPE_MASS[np.maximum(type_index - 1, 0)], 0.02)
+    mass = np.exp(rng.uniform(np.log(lower), np.log(upper)))
+    radius = np.where(mass < 120, mass ** 0.55, 11.2 * rng.uniform(0.9, 1.3, size))
+    equilibrium = 278.5 * luminosity ** 0.25 / np.sqrt(semi_major_axis)
+
+    # habitable: rocky planets with an earth-like equilibrium temperature, mostly around K and M stars
+    rocky = np.isin(planet_type, ['Subterran', 'Terran', 'Superterran'])
+    temperate = (equilibrium > 180) & (equilibrium < 310)
+    chance = np.where(rocky & temperate, np.where(np.isin(star_type, ['K', 'M']), 0.6, 0.3), 0.002)
+    habitable = np.where(rng.random(size) < chance, np.where(rng.random(size) < 0.6, 1.0, 2.0), 0.0)
+    # the PHL has not rated the most recent discoveries
+    rated = rng.random(size) < np.where(year >= 2020, 0.05, 0.95)
+
+    nea = pd.DataFrame({
+        'pl_name': names,
+        'hostname': hostnames,
+        'pl_letter': letters,
+        'sy_snum': 1 + (rng.random(size) < 0.1),
+        'sy_pnum': np.bincount(hosts - first_host)[hosts - first_host],
+        'discoverymethod': method,
+        'disc_year': year,
+        'disc_locale': locale,
+        'disc_telescope': telescope,
+        'pl_orbper': period,
+        'pl_orbsmax': semi_major_axis,
+        'pl_rade': radius,
+        'pl_bmasse': mass,
+        'pl_orbeccen': rng.beta(0.9, 5, size),
+        'pl_eqt': equilibrium,
+        'st_teff': teff,
+        'st_rad': star_radius,
+        'st_mass': star_mass,
+        'st_lum': np.log10(luminosity),
+        'sy_dist': distance,
+        'sy_disterr1': distance * rng.uniform(0.005, 0.1, size),
+        'P_HABITABLE': np.where(rated, habitable, np.nan),
+        'S_CONSTELLATION': _choice(rng, CONSTELLATIONS, np.ones(len(CONSTELLATIONS)), size),
+    })
+    nea.loc[~rated, 'S_CONSTELLATION'] = None
+
+    phl = pd.DataFrame({
+        'P_NAME': names[rated],
+        'S_TYPE_TEMP': star_type[rated],
+        'P_TYPE': planet_type[rated],
+        'S_AGE': np.clip(rng.gamma(2.2, 2.0, size), 0.01, 14)[rated],
+        'P_DISTANCE': semi_major_axis[rated],
+        'S_TEMPERATURE': teff[rated],
+        'P_HABITABLE': habitable[rated],
+    })
+    return nea, phl, hosts[-1] + 1 if size else first_host
+
+
+def generate_chunks(rows, chunksize=CHUNKSIZE, seed=0):
+    """Yield ``(nea, phl)`` chunks totalling ``rows`` planets."""
+    next_host = 0
+    for index, start in enumerate(range(0, rows, chunksize)):
+        rng = np.random.default_rng([seed, index])
+        nea, phl, next_host = generate_chunk(rng, min(chunksize, rows - start), next_host)
+        nea.index += start
+        yield nea, phl
+
+
+def generate(rows, seed=0, chunksize=CHUNKSIZE):
+    """``(nea, phl)`` frames of ``rows`` planets, in memory."""
+    chunks = list(generate_chunks(rows, chunksize, seed))
+    return (pd.concat([nea for nea, _ in chunks]),
+            pd.concat([phl for _, phl in chunks], ignore_index=True))
+
+
+class _ChunkWriter:
+    """Appends frames to a CSV or Parquet file, depending on its extension."""
+
+    def __init__(self, path):
+        self.path = path
+        self._parquet = None
+        self._header = True
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    def write(self, frame):
+        if self.path.endswith('.parquet'):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table.cast(self._parquet.schema))
+        else:
+            frame.to_csv(self.path, mode='w' if self._header else 'a', header=self._header, index=False)
+            self._header = False
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def write_catalogs(rows, nea_path, phl_path, chunksize=CHUNKSIZE, seed=0):
+    """Stream ``rows`` synthetic planets to ``nea_path`` and their PHL rows to ``phl_path``."""
+    writers = _ChunkWriter(nea_path), _ChunkWriter(phl_path)
+    try:
+        for chunk in generate_chunks(rows, chunksize, seed):
+            for writer, frame in zip(writers, chunk):
+                writer.write(frame)
+    finally:
+        for writer in writers:
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write synthetic NEA and PHL catalogs.")
+    parser.add_argument('rows', type=int, help="number of planets")
+    parser.add_argument('--nea', default=os.path.join('data', 'synthetic', 'planets.csv'))
+    parser.add_argument('--phl', default=os.path.join('data', 'synthetic', 'phl.csv'))
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    write_catalogs(args.rows, args.nea, args.phl, args.chunksize, args.seed)
+    print(f'{args.rows} planets written to {args.nea} and {args.phl}')
+
+
+if __name__ == '__main__':
+    main()
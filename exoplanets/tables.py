@@ -0,0 +1,91 @@
+"""Server-side filtering, sorting and pagination of result tables.
+
+The WebApp used to send whole frames to the browser. A ``ResultTable`` keeps
+the frame on the server and answers one page at a time: filters are
+vectorized masks, and the order of each sort column is computed once and
+reused, so an interaction costs O(rows) and only ``page_size`` rows are
+serialized.
+
+Tables are shared by every session through ``get_table``, keyed by the
+versions of the data they were built from: do not mutate their frame.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+PAGE_SIZE = 50
+# tables kept per process
+MAX_TABLES = 8
+
+_tables = OrderedDict()
+_tables_lock = threading.Lock()
+
+
+class ResultTable:
+
+    def __init__(self, frame):
+        self.frame = frame
+        self._orders = {}
+        self._lock = threading.Lock()
+
+    def options(self, column):
+        """Distinct values of ``column``, sorted, for a filter widget."""
+        return sorted(self.frame[column].dropna().unique())
+
+    def bounds(self, column):
+        return self.frame[column].min(), self.frame[column].max()
+
+    def order(self, column, ascending=True):
+        """Row positions sorted by ``column``, missing values last, computed once."""
+        key = (column, ascending)
+        order = self._orders.get(key)
+        if order is None:
+            values = self.frame[column].reset_index(drop=True)
+            order = values.sort_values(ascending=ascending, kind='mergesort').index.to_numpy()
+            with self._lock:
+                self._orders[key] = order
+        return order
+
+    def mask(self, filters):
+        """Rows matching every filter: a list of accepted values or a ``(low, high)`` range."""
+        mask = np.ones(len(self.frame), dtype=bool)
+        for column, accepted in (filters or {}).items():
+            values = self.frame[column]
+            if isinstance(accepted, tuple):
+                mask &= values.between(*accepted).to_numpy()
+            else:
+                mask &= values.isin(accepted).to_numpy()
+        return mask
+
+    def query(self, filters=None, sort=None, ascending=True, page=0, page_size=PAGE_SIZE):
+        """Rows of page ``page`` (from 0) and the number of rows matching ``filters``."""
+        mask = self.mask(filters)
+        if sort is None:
+            rows = np.flatnonzero(mask)
+        else:
+            order = self.order(sort, ascending)
+            rows = order[mask[order]]
+        start = page * page_size
+        return self.frame.iloc[rows[start:start + page_size]], len(rows)
+
+
+def get_table(key, build):
+    """Table for ``key``, from ``build()`` the first time, shared by every session."""
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is not None:
+            _tables.move_to_end(key)
+            return table
+    table = ResultTable(build())
+    with _tables_lock:
+        table = _tables.setdefault(key, table)
+        _tables.move_to_end(key)
+        while len(_tables) > MAX_TABLES:
+            _tables.popitem(last=False)
+    return table
+
+
+def clear():
+    with _tables_lock:
+        _tables.clear()
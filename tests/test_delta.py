@@ -0,0 +1,64 @@
+import pandas as pd
+
+from exoplanets import delta
+from exoplanets.derived import DERIVED_TABLES, load_derived
+from exoplanets.snapshot import ingest, snapshot_path, snapshot_version
+from exoplanets.synthetic import generate
+
+from tests.test_derived import _sorted
+
+
+def _dumps(tmp_path):
+    nea, _ = generate(1500, seed=10)
+    nea = nea.reset_index(drop=True)
+    old, new = str(tmp_path / 'old.csv'), str(tmp_path / 'new.csv')
+    nea.iloc[:1200].to_csv(old, index=False)
+
+    # read back exactly, so that rewriting the dump does not change the untouched values
+    dump = pd.read_csv(old, float_precision='round_trip')
+    dump = dump.drop(index=range(0, 60, 3))
+    dump.loc[100:109, 'disc_locale'] = 'Space'
+    dump.loc[200:204, 'pl_orbper'] = dump.loc[200:204, 'pl_orbper'] * 2 + 1
+    pd.concat([dump, nea.iloc[1200:1300]]).to_csv(new, index=False)
+    before = pd.read_csv(old, float_precision='round_trip').loc[dump.index]
+    updated = dump.loc[(before['disc_locale'] != 'Space') & dump.index.isin(range(100, 110))
+                       | dump.index.isin(range(200, 205)), 'pl_name']
+    return old, new, set(updated)
+
+
+def test_apply_delta_matches_full_ingest(tmp_path):
+    old, new, updated = _dumps(tmp_path)
+    applied, full = str(tmp_path / 'applied'), str(tmp_path / 'full')
+    ingest('nea', old, applied)
+    before = snapshot_version('nea', applied)
+
+    change = delta.apply_delta('nea', new, applied, chunksize=250)
+    assert (len(change.inserted), len(change.deleted)) == (100, 20)
+    assert set(change.updated) == updated
+    assert {'disc_locale', 'pl_orbper'} <= change.changed_columns
+    assert snapshot_version('nea', applied) != before
+
+    ingest('nea', new, full)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(snapshot_path('nea', applied)).sort_values('pl_name').reset_index(drop=True),
+        pd.read_parquet(snapshot_path('nea', full)).sort_values('pl_name').reset_index(drop=True))
+    for table in DERIVED_TABLES['nea']:
+        pd.testing.assert_frame_equal(_sorted(load_derived('nea', table.name, applied)),
+                                      _sorted(load_derived('nea', table.name, full)))
+
+
+def test_unchanged_dump_is_an_empty_delta(tmp_path):
+    old, _, _ = _dumps(tmp_path)
+    ingest('nea', old, str(tmp_path))
+    version = snapshot_version('nea', str(tmp_path))
+    change = delta.apply_delta('nea', old, str(tmp_path))
+    assert change is not None and not change
+    assert snapshot_version('nea', str(tmp_path)) == version
+
+
+def test_new_columns_fall_back_to_full_ingest(tmp_path):
+    old, new, _ = _dumps(tmp_path)
+    ingest('nea', old, str(tmp_path))
+    pd.read_csv(new).assign(extra=1).to_csv(new, index=False)
+    assert delta.apply_delta('nea', new, str(tmp_path)) is None
+    assert 'extra' in pd.read_parquet(snapshot_path('nea', str(tmp_path))).columns
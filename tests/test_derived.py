@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from exoplanets.derived import DERIVED_TABLES
+from exoplanets.snapshot import to_snapshot_dtypes
+from exoplanets.synthetic import generate
+
+
+def _table(snapshot, name):
+    return next(t for t in DERIVED_TABLES[snapshot] if t.name == name)
+
+
+def _sorted(table):
+    keys = [c for c in table.columns if c != 'count']
+    return table.sort_values(keys, na_position='first').reset_index(drop=True)
+
+
+def catalogs():
+    nea, phl = generate(2000, seed=1)
+    nea.loc[nea.index[::7], 'disc_locale'] = np.nan
+    nea.loc[nea.index[::11], 'discoverymethod'] = None
+    phl.loc[phl.index[::5], 'S_TYPE_TEMP'] = np.nan
+    phl.loc[phl.index[::9], 'S_AGE'] = np.nan
+    return to_snapshot_dtypes(nea.reset_index(drop=True)), to_snapshot_dtypes(phl.reset_index(drop=True))
+
+
+def test_build_counts_missing_keys():
+    nea, phl = catalogs()
+    assert _table('nea', 'discovery_cube').build(nea)['count'].sum() == len(nea)
+    counts = _table('phl', 'habitability_profile').build(phl)
+    assert counts['count'].sum() == len(phl)
+    assert counts.loc[counts['S_TYPE_TEMP'].isna(), 'count'].sum() == phl['S_TYPE_TEMP'].isna().sum()
+
+
+def test_update_matches_build_with_missing_keys():
+    nea, phl = catalogs()
+    for snapshot, name, frame in (('nea', 'discovery_cube', nea), ('phl', 'habitability_profile', phl)):
+        table = _table(snapshot, name)
+        base, inserted, deleted = frame.iloc[:1500], frame.iloc[1500:], frame.iloc[:200]
+        current = pd.concat([frame.iloc[200:1500], inserted])
+        updated = table.update(table.build(base), deleted, inserted)
+        pd.testing.assert_frame_equal(_sorted(updated), _sorted(table.build(current)))
+
@@ -0,0 +1,27 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from exoplanets.figures import FigureCache, figure_size
+
+
+def _scatter(points):
+    return go.Figure(go.Scatter(x=np.arange(points, dtype=float), y=np.ones(points),
+                                text=[f'SYN-{i} b' for i in range(points)], marker=dict(color=np.zeros(points))))
+
+
+def test_size_counts_the_points_without_serializing(monkeypatch):
+    small, large = _scatter(100), _scatter(10000)
+    monkeypatch.setattr(go.Figure, 'to_json', lambda self, *args, **kwargs: 1 / 0)
+    assert 3 * 8 * 10000 < figure_size(large)
+    assert 50 * figure_size(small) < figure_size(large) < 200 * figure_size(small)
+
+
+def test_least_recently_used_evicted_over_the_cap():
+    figures = {key: _scatter(1000) for key in 'abc'}
+    cache = FigureCache(max_bytes=int(2.5 * figure_size(figures['a'])))
+    cache.put('a', figures['a'])
+    cache.put('b', figures['b'])
+    assert cache.get('a') is figures['a']
+    cache.put('c', figures['c'])
+    assert cache.get('b') is None and cache.get('a') is figures['a'] and cache.get('c') is figures['c']
+    assert cache.size <= cache.max_bytes
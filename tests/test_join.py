@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from exoplanets import join
+
+NEA = pd.DataFrame({'pl_name': ['Kepler-22 b', 'Gliese 667 C c', 'TOI-700  d', 'K2-18 b', 'Proxima Cen b'],
+                    'sy_dist': [190.0, 7.2, 31.1, 38.0, 1.3],
+                    'P_HABITABLE': [1, 1, np.nan, 2, 1]})
+PHL = pd.DataFrame({'P_NAME': ['TOI-700 d', 'Kepler-22 b', 'GJ 667 C c', 'Kepler-22 b'],
+                    'P_TYPE': ['Terran', 'Superterran', 'Superterran', 'Jovian']})
+
+
+def test_exact_then_normalized_matches():
+    index = join.JoinIndex.build(NEA['pl_name'], PHL['P_NAME'])
+    np.testing.assert_array_equal(index.phl_rows, [1, 2, 0, -1, -1])
+    assert list(index.match) == [join.EXACT, join.NORMALIZED, join.NORMALIZED, join.UNMATCHED, join.UNMATCHED]
+
+
+def test_join_is_a_left_merge():
+    joined = join.JoinIndex.build(NEA['pl_name'], PHL['P_NAME']).join(NEA, PHL)
+    assert joined.index.equals(NEA.index)
+    assert joined['P_TYPE'].tolist()[:3] == ['Superterran', 'Superterran', 'Terran']
+    assert joined['P_TYPE'].iloc[3:].isna().all()
+
+
+def test_unmatched_reports_rated_planets_only():
+    index = join.JoinIndex.build(NEA['pl_name'], PHL['P_NAME'])
+    assert index.unmatched(NEA) == ['K2-18 b', 'Proxima Cen b']
+
+
+def test_index_persisted_per_snapshot_pair(tmp_path):
+    index = join.load_or_build(NEA, PHL, 'a', 'b', snapshot_dir=str(tmp_path))
+    path = join.index_path('a', 'b', str(tmp_path))
+    loaded = join.JoinIndex.load(path)
+    np.testing.assert_array_equal(loaded.phl_rows, index.phl_rows)
+    assert list(loaded.match) == list(index.match)
+
+    # another catalog version gets its own index
+    grown = pd.concat([NEA, pd.DataFrame({'pl_name': ['GJ 667 C c'], 'sy_dist': [7.2], 'P_HABITABLE': [1]})],
+                      ignore_index=True)
+    rebuilt = join.load_or_build(grown, PHL, 'c', 'b', snapshot_dir=str(tmp_path))
+    assert len(rebuilt.phl_rows) == len(grown) and rebuilt.match[-1] == join.EXACT
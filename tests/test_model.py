@@ -0,0 +1,68 @@
+import time
+
+import numpy as np
+
+from exoplanets import model as habitability
+from exoplanets.features import TARGET
+from exoplanets.synthetic import generate
+
+
+def test_interval_contains_probability():
+    nea, _ = generate(3000, seed=2)
+    artifact = habitability.train(nea, 'test', bootstrap=8)
+    assert len(artifact['ensemble']) == 8
+
+    unrated = nea[nea[TARGET].isna()]
+    scores = habitability.predict_proba(artifact, unrated, interval=True)
+    assert len(scores) and scores[['probability', 'low', 'high']].notna().all().all()
+    assert (scores['low'] <= scores['probability']).all()
+    assert (scores['probability'] <= scores['high']).all()
+    assert np.isin(scores['prediction'], artifact['model'].classes_).all()
+
+    # one source for the class and probability, whichever the entry point
+    np.testing.assert_array_equal(scores['prediction'], habitability.predict(artifact, unrated))
+    np.testing.assert_allclose(scores['probability'], habitability.habitable_probability(artifact, unrated))
+    without = habitability.predict_proba(artifact, unrated)
+    np.testing.assert_allclose(without['probability'], scores['probability'])
+    assert without['low'].isna().all() and without['high'].isna().all()
+
+
+def test_without_ensemble_bounds_are_nan():
+    nea, _ = generate(1000, seed=3)
+    artifact = habitability.train(nea, 'test', bootstrap=0)
+    scores = habitability.predict_proba(artifact, nea.head(50), interval=True)
+    assert scores['low'].isna().all() and scores['high'].isna().all()
+    np.testing.assert_allclose(scores['probability'], habitability.habitable_probability(artifact, nea.head(50)))
+
+
+def test_ensemble_trained_off_the_request_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(habitability, 'BOOTSTRAP', 2)
+    nea, _ = generate(1000, seed=4)
+    artifact = habitability.load_or_train(nea, model_dir=str(tmp_path))
+    assert artifact['ensemble'] == []
+
+    habitability.ensemble_in_background(nea, model_dir=str(tmp_path))
+    version = artifact['dataset_version']
+    deadline = time.monotonic() + 120
+    while not habitability.load_or_train(nea, model_dir=str(tmp_path))['ensemble']:
+        assert time.monotonic() < deadline
+        time.sleep(0.1)
+    assert len(habitability.load(version, str(tmp_path))['ensemble']) == 2
+    assert habitability.model_version(artifact, interval=True) != habitability.model_version(
+        habitability.load_or_train(nea, model_dir=str(tmp_path)), interval=True)
+
+
+def test_list_versions_reads_only_the_sidecars(tmp_path, monkeypatch):
+    nea, _ = generate(500, seed=5)
+    artifact = habitability.train(nea, 'current', bootstrap=0)
+    habitability.save(artifact, str(tmp_path))
+    habitability.save(dict(artifact, dataset_version='older', format=habitability.ARTIFACT_FORMAT - 1), str(tmp_path))
+    # saved before the sidecars existed
+    (tmp_path / 'habitability-legacy.pkl').write_bytes(b'')
+
+    def no_unpickling(*args, **kwargs):
+        raise AssertionError('list_versions must not load the models')
+
+    monkeypatch.setattr(habitability, 'load', no_unpickling)
+    monkeypatch.setattr(habitability.pickle, 'load', no_unpickling)
+    assert habitability.list_versions(str(tmp_path)) == ['current']
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from exoplanets import model as habitability
+from exoplanets.features import TARGET
+from exoplanets.predictions import PredictionStore
+from exoplanets.synthetic import generate
+
+
+def _counting(monkeypatch):
+    scored = []
+    predict_proba = habitability.predict_proba
+
+    def counted(artifact, planets, *args, **kwargs):
+        scored.append(len(planets))
+        return predict_proba(artifact, planets, *args, **kwargs)
+
+    monkeypatch.setattr(habitability, 'predict_proba', counted)
+    return scored
+
+
+def test_only_new_or_changed_planets_are_scored(tmp_path, monkeypatch):
+    nea, _ = generate(2000, seed=12)
+    artifact = habitability.train(nea, 'test', bootstrap=0)
+    planets = nea.head(300)
+    scored = _counting(monkeypatch)
+
+    path = str(tmp_path / 'predictions.parquet')
+    first = PredictionStore(path).score(artifact, planets)
+    expected = habitability.predict_proba(artifact, planets)
+    np.testing.assert_allclose(first['probability'], expected['probability'])
+    assert first.index.equals(planets.index)
+
+    changed = planets.copy()
+    changed.loc[changed.index[:5], 'pl_orbper'] = changed.loc[changed.index[:5], 'pl_orbper'] * 2 + 1
+    grown = pd.concat([changed, nea.iloc[300:310]])
+    scored.clear()
+    # read back from disk, as in another process
+    again = PredictionStore(path).score(artifact, grown)
+    assert scored == [15]
+    np.testing.assert_allclose(again['probability'], habitability.predict_proba(artifact, grown)['probability'])
+
+
+def test_interval_and_model_change_rescore(tmp_path, monkeypatch):
+    nea, _ = generate(1000, seed=13)
+    artifact = habitability.train(nea, 'test', bootstrap=2)
+    unrated = nea[nea[TARGET].isna()].head(50)
+    store = PredictionStore(str(tmp_path / 'predictions.parquet'))
+    scored = _counting(monkeypatch)
+
+    assert store.score(artifact, unrated)['low'].isna().all()
+    bounded = store.score(artifact, unrated, interval=True)
+    assert bounded['low'].notna().all()
+    store.score(artifact, unrated, interval=True)
+    store.score(dict(artifact, dataset_version='other'), unrated)
+    assert scored == [50, 50, 50]
@@ -0,0 +1,15 @@
+from exoplanets.derived import DERIVED_TABLES
+from exoplanets.profiles import profile_keys
+
+from tests.test_derived import catalogs
+
+
+def test_profile_totals_match_catalog():
+    _, phl = catalogs()
+    keys = profile_keys(phl)
+    counts = next(t for t in DERIVED_TABLES['phl'] if t.name == 'habitability_profile').build(phl)
+    assert counts['count'].sum() == len(phl)
+    for key in ('S_TYPE_TEMP', 'P_TYPE', 'age_group'):
+        assert counts.groupby(key, dropna=False)['count'].sum().sum() == len(phl)
+        known = counts[counts[key].notna()]
+        assert known['count'].sum() == keys[key].notna().sum()
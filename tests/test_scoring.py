@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from exoplanets import model as habitability
+from exoplanets import scoring
+from exoplanets.synthetic import generate
+
+
+def test_score_file_keeps_rows_in_order_and_missing_names_null(tmp_path):
+    nea, _ = generate(1000, seed=8)
+    artifact = habitability.train(nea, 'test', bootstrap=2)
+    habitability.save(artifact, str(tmp_path))
+
+    catalog = nea.head(300).reset_index(drop=True)
+    catalog.loc[[3, 250], 'pl_name'] = np.nan
+    source = str(tmp_path / 'candidates.csv')
+    catalog.to_csv(source, index=False)
+
+    output = str(tmp_path / 'scores.parquet')
+    rows = scoring.score_file(source, output, 'test', str(tmp_path), chunksize=100, workers=1, interval=True)
+    scores = pd.read_parquet(output)
+    assert rows == len(scores) == len(catalog)
+    assert scores['pl_name'].isna().tolist() == catalog['pl_name'].isna().tolist()
+    assert (scores['low'] <= scores['probability']).all() and (scores['probability'] <= scores['high']).all()
+    expected = habitability.predict_proba(artifact, pd.read_csv(source))
+    np.testing.assert_allclose(scores['probability'], expected['probability'], rtol=1e-6)
+
+
+def test_workers_run_every_booster_single_threaded(tmp_path):
+    nea, _ = generate(500, seed=9)
+    habitability.save(habitability.train(nea, 'test', bootstrap=2), str(tmp_path))
+    scoring._init_worker('test', str(tmp_path), False)
+    boosters = [scoring._artifact['model']] + scoring._artifact['ensemble']
+    assert [booster.get_params()['n_jobs'] for booster in boosters] == [1, 1, 1]
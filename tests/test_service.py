@@ -0,0 +1,75 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from exoplanets import model as habitability
+from exoplanets import service
+from exoplanets.synthetic import generate
+
+
+@pytest.fixture(scope='module')
+def artifact():
+    nea, _ = generate(1000, seed=6)
+    return habitability.train(nea, 'test', bootstrap=0)
+
+
+@pytest.fixture(scope='module')
+def records():
+    nea, _ = generate(20, seed=7)
+    return json.loads(nea.to_json(orient='records'))
+
+
+def test_batched_requests_get_their_own_rows(artifact, records):
+    batcher = service.MicroBatcher(artifact, max_wait=0.2)
+    frames = [service.records_frame(records[i:i + 5], artifact['pipeline']) for i in range(0, 20, 5)]
+    futures = [batcher.submit(frame) for frame in frames]
+    for frame, future in zip(frames, futures):
+        predictions = future.result(timeout=10)
+        assert [p['pl_name'] for p in predictions] == frame['pl_name'].tolist()
+        assert all(0 <= p['probability'] <= 1 and p['low'] is None for p in predictions)
+    assert batcher.stats.batches == 1
+
+
+def test_failing_record_only_fails_its_request(artifact, records):
+    batcher = service.MicroBatcher(artifact, max_wait=0.2)
+    valid = service.records_frame(records[:3], artifact['pipeline'])
+    # past the checks of records_frame, as if a column were not validated
+    invalid = valid.head(1).assign(st_mass='heavy')
+    good, bad = batcher.submit(valid), batcher.submit(invalid)
+    assert len(good.result(timeout=10)) == 3
+    with pytest.raises(ValueError):
+        bad.result(timeout=10)
+
+
+def test_records_frame_checks_astrophysical_inputs(artifact, records):
+    record = dict(records[0], st_mass='heavy')
+    with pytest.raises(ValueError):
+        service.records_frame(record, artifact['pipeline'])
+    with pytest.raises(ValueError):
+        service.records_frame(dict(records[0], st_teff=[5000]), artifact['pipeline'])
+
+
+def test_http_statuses(artifact, records):
+    server = service.make_server(artifact, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}/predict'
+
+    def post(body):
+        request = urllib.request.Request(url, json.dumps(body).encode(), method='POST')
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status, json.load(response)
+        except urllib.error.HTTPError as error:
+            return error.code, json.load(error)
+
+    try:
+        status, body = post(records[:2])
+        assert status == 200 and len(body['predictions']) == 2
+        assert post(dict(records[0], st_mass='heavy'))[0] == 400
+        assert post('not a record')[0] == 400
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from exoplanets import model as habitability
+from exoplanets import similarity
+from exoplanets.features import TARGET
+from exoplanets.synthetic import generate
+
+
+@pytest.fixture(scope='module')
+def planets():
+    nea, _ = generate(3000, seed=11)
+    return nea.reset_index(drop=True)
+
+
+@pytest.fixture(scope='module')
+def index(planets):
+    return similarity.SimilarityIndex(planets, habitability.train(planets, 'test', bootstrap=0)['pipeline'])
+
+
+def test_matches_brute_force(planets, index):
+    queries = planets[planets[TARGET].isna()].head(20)
+    results = index.query(queries, k=4)
+    habitable = index.standardize(planets[planets[TARGET].isin(similarity.HABITABLE)])
+    for (name, rows), point in zip(results.groupby('pl_name', sort=False), index.standardize(queries)):
+        distances = np.sort(np.linalg.norm(habitable - point, axis=1))[:4]
+        np.testing.assert_allclose(rows['distance'], distances)
+        assert rows['rank'].tolist() == [1, 2, 3, 4]
+
+
+def test_habitable_planet_is_not_its_own_neighbour(planets, index):
+    name = index.names[0]
+    results = index.similar(name, k=3)
+    assert name not in results['similar'].tolist() and results['rank'].tolist() == [1, 2, 3]
+
+    # k covering the whole index: every other habitable planet, ranked from 1
+    everyone = index.similar(name, k=len(index.names))
+    assert len(everyone) == len(index.names) - 1 and name not in everyone['similar'].tolist()
+    assert everyone['rank'].tolist() == list(range(1, len(index.names)))
+    assert everyone['distance'].is_monotonic_increasing
+
+
+def test_unknown_name_raises(index):
+    with pytest.raises(KeyError):
+        index.similar('Not a planet')